@@ -68,7 +68,9 @@ case "$1" in
     allure)
         echo -e "${BLUE}Generating Allure report...${NC}"
         if command -v allure &> /dev/null; then
-            allure generate outputs/allure-results -o outputs/allure-report --clean
+            # xdist runs write per-worker subdirectories (outputs/allure-results/gw*)
+            allure generate outputs/allure-results $(ls -d outputs/allure-results/gw* 2>/dev/null) \
+                -o outputs/allure-report --clean
             echo -e "${GREEN}Allure report generated: outputs/allure-report${NC}"
             echo -e "${YELLOW}To view report: allure open outputs/allure-report${NC}"
         else
@@ -10,7 +10,7 @@ Version: 1.0.0
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 
@@ -36,6 +36,18 @@ LOGS_DIR = PROJECT_ROOT / "outputs" / "logs"
 VIDEOS_DIR = PROJECT_ROOT / "outputs" / "videos"
 FIXTURES_DIR = PROJECT_ROOT / "fixtures"
 
+# Last-known-good component versions reused by batch verification across runs
+STATE_FILE = Path(
+    os.getenv("VERIFICATION_STATE_FILE", str(PROJECT_ROOT / "outputs" / ".verification_state.json"))
+)
+
+# pytest-xdist workers log to their own directory and keep their own state file
+# (rotating log files and the state file can't be shared)
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    LOGS_DIR = LOGS_DIR / XDIST_WORKER
+    STATE_FILE = STATE_FILE.with_suffix(f".{XDIST_WORKER}.json")
+
 # Ensure directories exist
 for directory in [REPORTS_DIR, SCREENSHOTS_DIR, LOGS_DIR, VIDEOS_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
@@ -74,6 +86,8 @@ class TestConfig:
     HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
     BROWSER_WIDTH = int(os.getenv("BROWSER_WIDTH", "1920"))
     BROWSER_HEIGHT = int(os.getenv("BROWSER_HEIGHT", "1080"))
+    # Skip image decoding (Chrome); set false for screenshot-dependent tests
+    DISABLE_IMAGES = os.getenv("DISABLE_IMAGES", "true").lower() == "true"
 
     # ==================== WebDriver Version Management ====================
     # ChromeDriver version management (3 modes):
@@ -94,13 +108,20 @@ class TestConfig:
     EDGEDRIVER_VERSION = os.getenv("EDGEDRIVER_VERSION", None)
 
     # ==================== Timeout Configuration ====================
-    IMPLICIT_WAIT = 10  # seconds
+    IMPLICIT_WAIT = 10  # seconds (not applied to the driver - implicit wait is 0)
     EXPLICIT_WAIT = 30  # seconds
     PAGE_LOAD_TIMEOUT = 60  # seconds
     SCRIPT_TIMEOUT = 30  # seconds
+    FRAME_POLL_FREQUENCY = 0.05  # seconds (frame switch / frame body waits)
 
     # ==================== Test Configuration ====================
     TARGET_KERNEL_VERSION = os.getenv("TARGET_KERNEL_VERSION", "5.14.0-427.24.1.el9_4.x86_64")
+    # CSS selector of the kernel version element in the System Updates frame;
+    # empty = search the whole frame text
+    KERNEL_VERSION_SELECTOR = os.getenv("KERNEL_VERSION_SELECTOR", "")
+
+    # Last-known-good component versions (one file per xdist worker)
+    VERIFICATION_STATE_FILE = str(STATE_FILE)
 
     # ==================== Retry Configuration ====================
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "2"))
@@ -108,9 +129,14 @@ class TestConfig:
 
     # ==================== Screenshot Configuration ====================
     SCREENSHOT_ON_FAILURE = True
-    SCREENSHOT_ON_SUCCESS = False
+    # Checkpoint screenshots on passing steps (DebugContext) - off unless debugging
+    SCREENSHOT_ON_SUCCESS = os.getenv("CAPTURE_SCREENSHOTS_ON_PASS", "false").lower() == "true"
     SAVE_HTML_ON_FAILURE = True
     SAVE_BROWSER_LOGS_ON_FAILURE = True
+    # Browser console log collection adds per-request overhead - off by default in CI
+    CAPTURE_BROWSER_LOGS = (
+        os.getenv("CAPTURE_BROWSER_LOGS", "false" if os.getenv("CI") else "true").lower() == "true"
+    )
 
     # ==================== Video Recording Configuration ====================
     ENABLE_VIDEO_RECORDING = os.getenv("ENABLE_VIDEO", "false").lower() == "true"
@@ -124,6 +150,8 @@ class TestConfig:
     # ==================== Allure Configuration ====================
     ALLURE_RESULTS_DIR = str(REPORTS_DIR / "allure-results")
     ALLURE_REPORT_DIR = str(REPORTS_DIR / "allure-report")
+    # QA_ALLURE_VERBOSE=0 skips plain-text step attachments (failure artifacts still attach)
+    ALLURE_VERBOSE = os.getenv("QA_ALLURE_VERBOSE", "1") != "0"
 
     # ==================== Chrome Options ====================
     CHROME_OPTIONS = [
@@ -169,6 +197,10 @@ class TestConfig:
         "log_dir": "/var/log/iwss",
     }
 
+    # ==================== Per-process memoization ====================
+    _validated = False
+    _config_summary: Optional[dict[str, Any]] = None
+
     @classmethod
     def get_config_summary(cls) -> dict[str, Any]:
         """
@@ -176,7 +208,17 @@ class TestConfig:
 
         Returns:
             dict: Configuration summary (sanitized - no passwords)
+
+        Note:
+            Built once per process (config is fixed after import); callers get a copy.
         """
+        if cls._config_summary is None:
+            cls._config_summary = cls._build_config_summary()
+        return dict(cls._config_summary)
+
+    @classmethod
+    def _build_config_summary(cls) -> dict[str, Any]:
+        """Build the sanitized configuration summary."""
         return {
             "environment": cls.ENVIRONMENT,
             "base_url": cls.BASE_URL,
@@ -201,7 +243,13 @@ class TestConfig:
 
         Raises:
             ValueError: If required configuration is missing
+
+        Note:
+            Only a successful validation is cached; failures re-raise on every call.
         """
+        if cls._validated:
+            return True
+
         required_fields = {
             "BASE_URL": cls.BASE_URL,
             "USERNAME": cls.USERNAME,
@@ -216,6 +264,7 @@ class TestConfig:
                 f"Please create a .env file with the required values."
             )
 
+        cls._validated = True
         return True
 
 
@@ -43,6 +43,7 @@ class DebugHelper:
         test_name: str,
         test_id: Optional[str] = None,
         exception: Optional[Exception] = None,
+        dom_artifacts: bool = True,
     ) -> dict[str, str]:
         """
         Capture all debugging artifacts when a test fails.
@@ -59,6 +60,8 @@ class DebugHelper:
             test_name: Test function name
             test_id: Test case ID (optional)
             exception: Exception that caused the failure (optional)
+            dom_artifacts: Capture browser-side artifacts. False for failures unrelated
+                to page state (SSH/backend) - only the traceback is saved.
 
         Returns:
             dict: Paths to all captured artifacts
@@ -78,6 +81,11 @@ class DebugHelper:
 
         artifacts = {}
 
+        if not dom_artifacts:
+            artifacts["traceback"] = DebugHelper.save_traceback(base_name, exception)
+            logger.info(f"📝 Traceback saved (non-DOM failure): {artifacts['traceback']}")
+            return artifacts
+
         try:
             # 1. Capture Screenshot
             if TestConfig.SCREENSHOT_ON_FAILURE:
@@ -91,8 +99,8 @@ class DebugHelper:
                 artifacts["html"] = html_path
                 logger.info(f"📄 HTML source saved: {html_path}")
 
-            # 3. Save browser logs
-            if TestConfig.SAVE_BROWSER_LOGS_ON_FAILURE:
+            # 3. Save browser logs (only collected when the capability was requested)
+            if TestConfig.SAVE_BROWSER_LOGS_ON_FAILURE and TestConfig.CAPTURE_BROWSER_LOGS:
                 logs_path = DebugHelper.save_browser_logs(driver, base_name)
                 artifacts["browser_logs"] = logs_path
                 logger.info(f"📋 Browser logs saved: {logs_path}")
@@ -282,6 +290,30 @@ class DebugHelper:
 
         return str(info_path)
 
+    @staticmethod
+    def save_traceback(name: str, exception=None, directory: Optional[Path] = None) -> str:
+        """
+        Save failure traceback as plain text (no browser round-trips).
+
+        Args:
+            name: File base name
+            exception: Exception or pytest longrepr (optional)
+            directory: Custom directory (optional, defaults to SCREENSHOTS_DIR)
+
+        Returns:
+            str: Path to saved traceback file
+
+        Example:
+            >>> path = DebugHelper.save_traceback("TC-VERIFY-002_failure", exception)
+        """
+        save_dir = directory or SCREENSHOTS_DIR
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+        traceback_path = save_dir / f"{name}_traceback.txt"
+        traceback_path.write_text(str(exception or "No traceback available"), encoding="utf-8")
+
+        return str(traceback_path)
+
     @staticmethod
     def save_network_logs(driver: WebDriver, name: str) -> Optional[str]:
         """
@@ -352,7 +384,9 @@ class DebugContext:
         ...     debug.checkpoint("Password entered")
     """
 
-    def __init__(self, driver: WebDriver, step_name: str, capture_screenshot: bool = False):
+    def __init__(
+        self, driver: WebDriver, step_name: str, capture_screenshot: Optional[bool] = None
+    ):
         """
         Initialize debug context.
 
@@ -360,9 +394,12 @@ class DebugContext:
             driver: WebDriver instance
             step_name: Name of the test step
             capture_screenshot: Whether to capture screenshots at checkpoints
+                (default: TestConfig.SCREENSHOT_ON_SUCCESS)
         """
         self.driver = driver
         self.step_name = step_name
+        if capture_screenshot is None:
+            capture_screenshot = TestConfig.SCREENSHOT_ON_SUCCESS
         self.capture_screenshot = capture_screenshot
         self.checkpoints = []
         self.logger = TestLogger.get_logger(__name__)
@@ -2,7 +2,7 @@
 Helper Modules Package
 
 Contains utility modules for test automation:
-- SSH Helper: Backend system access
+- SSH Helper: Backend system access (with pooled connections)
 - Video Recorder: Test execution recording (future)
 
 Note: Logger and DebugHelper are in core.logging and core.debugging respectively.
@@ -11,9 +11,10 @@ Author: QA Automation Team
 Version: 1.0.0
 """
 
-from .ssh_helper import SSHHelper, create_ssh_helper
+from .ssh_helper import SSHConnectionPool, SSHHelper, create_ssh_helper
 
 __all__ = [
     "SSHHelper",
+    "SSHConnectionPool",
     "create_ssh_helper",
 ]
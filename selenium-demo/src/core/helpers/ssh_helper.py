@@ -8,6 +8,7 @@ Author: QA Automation Team
 Version: 1.0.0
 """
 
+import threading
 from typing import Any, Optional
 
 import paramiko
@@ -109,6 +110,19 @@ class SSHHelper:
             self.connected = False
             raise
 
+    def is_alive(self) -> bool:
+        """
+        Check if the underlying SSH transport is still active.
+
+        Returns:
+            bool: True if connected and the transport is active
+        """
+        if not self.connected or not self.client:
+            return False
+
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
     def disconnect(self) -> None:
         """
         Close SSH connection.
@@ -428,6 +442,78 @@ class SSHHelper:
         return f"SSHHelper({self.username}@{self.host}:{self.port}, {status})"
 
 
+# ==================== Connection Pool ====================
+
+
+class SSHConnectionPool:
+    """
+    Process-wide pool of connected SSHHelper instances.
+
+    Connections are keyed by (host, port, username). Paramiko opens every
+    exec_command/SFTP session as a new channel on the pooled transport, so
+    callers sharing a key skip the TCP + key exchange + auth handshake.
+    Each key has its own lock, so connecting to one host never blocks another.
+
+    Example:
+        >>> from core.config.test_config import TestConfig
+        >>> ssh = SSHConnectionPool.acquire(TestConfig.SSH_CONFIG)
+        >>> output = ssh.execute_command_with_output('uname -r')
+        >>> SSHConnectionPool.close_all()
+    """
+
+    _connections: dict[tuple[str, int, str], SSHHelper] = {}
+    _key_locks: dict[tuple[str, int, str], threading.Lock] = {}
+    _registry_lock = threading.Lock()
+
+    @staticmethod
+    def _key(ssh_config: dict[str, Any]) -> tuple[str, int, str]:
+        """Build pool key from SSH config."""
+        return ssh_config["host"], ssh_config.get("port", 22), ssh_config["username"]
+
+    @classmethod
+    def acquire(cls, ssh_config: dict[str, Any]) -> SSHHelper:
+        """
+        Get a connected SSHHelper for the given config, reusing a pooled one.
+
+        Stale connections (inactive transport) are transparently re-established.
+
+        Args:
+            ssh_config: SSH configuration dictionary (see create_ssh_helper)
+
+        Returns:
+            SSHHelper: Connected SSH helper shared by all callers with the same key
+        """
+        key = cls._key(ssh_config)
+
+        with cls._registry_lock:
+            key_lock = cls._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            ssh = cls._connections.get(key)
+
+            if ssh is None:
+                ssh = create_ssh_helper(ssh_config)
+                cls._connections[key] = ssh
+
+            if not ssh.is_alive():
+                logger.debug(f"Opening pooled SSH connection: {key[2]}@{key[0]}:{key[1]}")
+                ssh.connect()
+
+            return ssh
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all pooled connections."""
+        with cls._registry_lock:
+            connections = list(cls._connections.values())
+            cls._connections.clear()
+            cls._key_locks.clear()
+
+        for ssh in connections:
+            if ssh.connected:
+                ssh.disconnect()
+
+
 # ==================== Factory Function ====================
 
 
@@ -211,9 +211,12 @@ class TestLogger:
         logger = cls.get_logger()
         step_num = cls.increment_step()
 
-        log_method = getattr(logger, level.lower(), logger.info)
-        log_method(
-            f"Step {step_num}: {step_description}",
+        # %-style args: logging skips formatting entirely when the level is disabled
+        logger.log(
+            getattr(logging, level.upper(), logging.INFO),
+            "Step %d: %s",
+            step_num,
+            step_description,
             extra={
                 "test_name": cls._current_test_context.get("test_name", "N/A"),
                 "step_number": step_num,
@@ -240,14 +243,13 @@ class TestLogger:
             ... )
         """
         logger = cls.get_logger()
-        status = "✓ PASS" if passed else "✗ FAIL"
 
         if passed:
-            logger.info(f"{status} - {item}: {actual}")
+            logger.info("✓ PASS - %s: %s", item, actual)
         else:
-            logger.error(f"{status} - {item}")
-            logger.error(f"  Expected: {expected}")
-            logger.error(f"  Actual:   {actual}")
+            logger.error("✗ FAIL - %s", item)
+            logger.error("  Expected: %s", expected)
+            logger.error("  Actual:   %s", actual)
 
     @classmethod
     def log_performance(cls, operation: str, duration: float, threshold: Optional[float] = None):
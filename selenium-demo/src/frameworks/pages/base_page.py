@@ -42,8 +42,14 @@ class BasePage:
     Attributes:
         driver: WebDriver instance
         wait: WebDriverWait instance with default timeout
+        frame_wait: WebDriverWait polling at TestConfig.FRAME_POLL_FREQUENCY
     """
 
+    # Rendered (visible) body text of the current document contains arguments[0]
+    BODY_CONTAINS_TEXT_SCRIPT = (
+        "return !!document.body && document.body.innerText.indexOf(arguments[0]) !== -1;"
+    )
+
     def __init__(self, driver: WebDriver):
         """
         Initialize base page object.
@@ -53,6 +59,11 @@ class BasePage:
         """
         self.driver = driver
         self.wait = WebDriverWait(driver, TestConfig.EXPLICIT_WAIT)
+        # Frames and frame bodies appear right after a switch or frame load - poll them
+        # finely instead of the default 0.5s
+        self.frame_wait = WebDriverWait(
+            driver, TestConfig.EXPLICIT_WAIT, poll_frequency=TestConfig.FRAME_POLL_FREQUENCY
+        )
         self.logger = logger
 
     # ==================== Frame Navigation ====================
@@ -78,12 +89,14 @@ class BasePage:
         """
         try:
             self.driver.switch_to.default_content()
-            self.wait.until(EC.frame_to_be_available_and_switch_to_it(frame_name))
-            self.logger.debug(f"✓ Switched to frame: {frame_name}")
+            # The wait's first poll is a plain switch_to.frame(); it only sleeps and
+            # retries while the frame is missing, so no direct-switch fast path is needed
+            self.frame_wait.until(EC.frame_to_be_available_and_switch_to_it(frame_name))
+            self.logger.debug("✓ Switched to frame: %s", frame_name)
             return True
 
         except TimeoutException as e:
-            self.logger.error(f"✗ Failed to switch to frame: {frame_name}")
+            self.logger.error("✗ Failed to switch to frame: %s", frame_name)
             TestLogger.log_exception(e, f"Frame switch timeout: {frame_name}")
             return False
 
@@ -114,7 +127,7 @@ class BasePage:
         """
         self.switch_to_frame(frame_name)
         try:
-            body = self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            body = self.frame_wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             return body.text
         finally:
             self.switch_to_default_content()
@@ -143,23 +156,22 @@ class BasePage:
         """
         import time
 
-        end_time = time.time() + timeout
+        end_time = time.perf_counter() + timeout
 
-        while time.time() < end_time:
+        while time.perf_counter() < end_time:
             try:
                 if self.switch_to_frame(frame_name):
-                    body = self.driver.find_element(By.TAG_NAME, "body")
-                    if expected_text in body.text:
-                        self.logger.debug(f"✓ Found '{expected_text}' in frame '{frame_name}'")
+                    if self.body_contains_text(expected_text):
+                        self.logger.debug("✓ Found '%s' in frame '%s'", expected_text, frame_name)
                         self.switch_to_default_content()
                         return True
-                    self.switch_to_default_content()
+                # No switch back here: the next switch_to_frame() starts from default content
             except Exception:
-                self.logger.debug(f"Waiting for '{expected_text}' in frame...")
+                self.logger.debug("Waiting for '%s' in frame...", expected_text)
 
             time.sleep(0.5)
 
-        self.logger.warning(f"✗ Timeout waiting for '{expected_text}' in frame '{frame_name}'")
+        self.logger.warning("✗ Timeout waiting for '%s' in frame '%s'", expected_text, frame_name)
         self.switch_to_default_content()
         return False
 
@@ -185,22 +197,23 @@ class BasePage:
                 return False
 
             # Try to find link with text
-            links = self.driver.find_elements(By.TAG_NAME, "a")
+            links = self.find_elements(By.TAG_NAME, "a", timeout=5)
             for link in links:
-                if text_content.lower() in link.text.lower():
-                    self.logger.debug(f"✓ Clicking '{link.text}' in frame '{frame_name}'")
+                link_text = link.text
+                if text_content.lower() in link_text.lower():
+                    self.logger.debug("✓ Clicking '%s' in frame '%s'", link_text, frame_name)
                     link.click()
                     self.switch_to_default_content()
                     return True
 
             self.logger.error(
-                f"✗ No element found with text '{text_content}' in frame '{frame_name}'"
+                "✗ No element found with text '%s' in frame '%s'", text_content, frame_name
             )
             self.switch_to_default_content()
             return False
 
         except Exception as e:
-            self.logger.error(f"✗ Failed to click element in frame: {e}")
+            self.logger.error("✗ Failed to click element in frame: %s", e)
             self.switch_to_default_content()
             return False
 
@@ -228,26 +241,31 @@ class BasePage:
             # Use PARTIAL_LINK_TEXT for more flexible matching
             try:
                 link = self.driver.find_element(By.PARTIAL_LINK_TEXT, search_text)
-                self.logger.debug(f"✓ Clicking link '{link.text}' in frame '{frame_name}'")
+                self.logger.debug("✓ Clicking link '*%s*' in frame '%s'", search_text, frame_name)
                 link.click()
                 self.switch_to_default_content()
                 return True
             except Exception:
                 # Fallback: search through all links
-                links = self.driver.find_elements(By.TAG_NAME, "a")
+                links = self.find_elements(By.TAG_NAME, "a", timeout=5)
                 for link in links:
-                    if search_text.lower() in link.text.lower():
-                        self.logger.debug(f"✓ Clicking link '{link.text}' in frame '{frame_name}'")
+                    link_text = link.text
+                    if search_text.lower() in link_text.lower():
+                        self.logger.debug(
+                            "✓ Clicking link '%s' in frame '%s'", link_text, frame_name
+                        )
                         link.click()
                         self.switch_to_default_content()
                         return True
 
-            self.logger.error(f"✗ No link found with text '{search_text}' in frame '{frame_name}'")
+            self.logger.error(
+                "✗ No link found with text '%s' in frame '%s'", search_text, frame_name
+            )
             self.switch_to_default_content()
             return False
 
         except Exception as e:
-            self.logger.error(f"✗ Failed to click link in frame: {e}")
+            self.logger.error("✗ Failed to click link in frame: %s", e)
             TestLogger.log_exception(e, f"Click link in frame failed: {frame_name}")
             self.switch_to_default_content()
             return False
@@ -271,16 +289,16 @@ class BasePage:
         Example:
             >>> element = page.find_element(By.ID, 'username')
         """
-        wait_time = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
+        # Default-timeout calls reuse the wait built in __init__
+        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
 
         try:
             element = wait.until(EC.presence_of_element_located((by, value)))
-            self.logger.debug(f"✓ Found element: {by}={value}")
+            self.logger.debug("✓ Found element: %s=%s", by, value)
             return element
 
         except TimeoutException:
-            self.logger.warning(f"✗ Element not found: {by}={value}")
+            self.logger.warning("✗ Element not found: %s=%s", by, value)
             return None
 
     def find_elements(self, by: By, value: str, timeout: Optional[int] = None) -> list[WebElement]:
@@ -298,16 +316,15 @@ class BasePage:
         Example:
             >>> links = page.find_elements(By.TAG_NAME, 'a')
         """
-        wait_time = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
+        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
 
         try:
             elements = wait.until(EC.presence_of_all_elements_located((by, value)))
-            self.logger.debug(f"✓ Found {len(elements)} elements: {by}={value}")
+            self.logger.debug("✓ Found %d elements: %s=%s", len(elements), by, value)
             return elements
 
         except TimeoutException:
-            self.logger.warning(f"✗ Elements not found: {by}={value}")
+            self.logger.warning("✗ Elements not found: %s=%s", by, value)
             return []
 
     def is_element_visible(self, by: By, value: str, timeout: Optional[int] = None) -> bool:
@@ -326,8 +343,7 @@ class BasePage:
             >>> if page.is_element_visible(By.ID, 'error_message'):
             ...     print("Error displayed")
         """
-        wait_time = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
+        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
 
         try:
             wait.until(EC.visibility_of_element_located((by, value)))
@@ -335,6 +351,25 @@ class BasePage:
         except TimeoutException:
             return False
 
+    def body_contains_text(self, text: str) -> bool:
+        """
+        Check if the current document's visible body text contains text.
+
+        One script call returning a boolean, instead of finding the body
+        element and then fetching its full text.
+
+        Args:
+            text: Text to search for (case-sensitive)
+
+        Returns:
+            bool: True if the body exists and contains the text
+
+        Example:
+            >>> page.switch_to_frame('right')
+            >>> page.body_contains_text('System Update')
+        """
+        return bool(self.driver.execute_script(self.BODY_CONTAINS_TEXT_SCRIPT, text))
+
     # ==================== Element Interactions ====================
 
     def click_element(self, by: By, value: str, timeout: Optional[int] = None) -> bool:
@@ -359,14 +394,13 @@ class BasePage:
 
         try:
             # Wait until element is clickable
-            wait = WebDriverWait(self.driver, TestConfig.EXPLICIT_WAIT)
-            clickable = wait.until(EC.element_to_be_clickable((by, value)))
+            clickable = self.wait.until(EC.element_to_be_clickable((by, value)))
             clickable.click()
-            self.logger.debug(f"✓ Clicked element: {by}={value}")
+            self.logger.debug("✓ Clicked element: %s=%s", by, value)
             return True
 
         except Exception as e:
-            self.logger.error(f"✗ Failed to click element: {by}={value}")
+            self.logger.error("✗ Failed to click element: %s=%s", by, value)
             TestLogger.log_exception(e, f"Click failed: {by}={value}")
             return False
 
@@ -398,11 +432,11 @@ class BasePage:
             if clear_first:
                 element.clear()
             element.send_keys(text)
-            self.logger.debug(f"✓ Entered text in: {by}={value}")
+            self.logger.debug("✓ Entered text in: %s=%s", by, value)
             return True
 
         except Exception as e:
-            self.logger.error(f"✗ Failed to enter text: {by}={value}")
+            self.logger.error("✗ Failed to enter text: %s=%s", by, value)
             TestLogger.log_exception(e, f"Text entry failed: {by}={value}")
             return False
 
@@ -483,15 +517,14 @@ class BasePage:
         Example:
             >>> page.wait_for_element_to_disappear(By.ID, 'loading_spinner')
         """
-        wait_time = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
+        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
 
         try:
             wait.until(EC.invisibility_of_element_located((by, value)))
-            self.logger.debug(f"✓ Element disappeared: {by}={value}")
+            self.logger.debug("✓ Element disappeared: %s=%s", by, value)
             return True
         except TimeoutException:
-            self.logger.warning(f"✗ Element still visible: {by}={value}")
+            self.logger.warning("✗ Element still visible: %s=%s", by, value)
             return False
 
     # ==================== Navigation ====================
@@ -506,7 +539,7 @@ class BasePage:
         Example:
             >>> page.navigate_to('https://example.com/login')
         """
-        self.logger.info(f"Navigating to: {url}")
+        self.logger.info("Navigating to: %s", url)
         self.driver.get(url)
         self.wait_for_page_load()
 
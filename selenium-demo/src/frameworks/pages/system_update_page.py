@@ -14,9 +14,12 @@ Version: 1.0.0
 import re
 from typing import Optional
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
 
+from core.config.test_config import TestConfig
 from core.logging.test_logger import TestLogger
 
 from .base_page import BasePage
@@ -50,6 +53,10 @@ class SystemUpdatePage(BasePage):
     RIGHT_FRAME = "right"
     LEFT_FRAME = "left"
     TOPHEAD_FRAME = "tophead"
+    REQUIRED_FRAMES = frozenset({TOPHEAD_FRAME, LEFT_FRAME, RIGHT_FRAME})
+
+    # Document loaded in right frame once System Updates is open
+    PAGE_DOCUMENT = "system_update.jsp"
 
     # Page elements (in right frame)
     PAGE_BODY = (By.TAG_NAME, "body")
@@ -59,8 +66,32 @@ class SystemUpdatePage(BasePage):
         "//*[contains(text(), 'kernel') or contains(text(), 'Kernel')]",
     )
 
-    # Regex pattern for kernel version
-    KERNEL_VERSION_PATTERN = r"(\d+\.\d+\.\d+-\d+\.\d+\.\d+\.el\d+[._]\d+\.x86_64)"
+    # Names of the top-level frames, in document order
+    FRAME_NAMES_SCRIPT = (
+        "return Array.from(document.getElementsByTagName('frame')).map(f => f.name);"
+    )
+
+    # Maps each top-level frame name to whether its document has a body
+    # (contentDocument is null for frames that are cross-origin or not yet created)
+    FRAME_ACCESSIBILITY_SCRIPT = """
+        var out = {};
+        var frames = window.top.document.querySelectorAll("frame, iframe");
+        for (var i = 0; i < frames.length; i++) {
+            var doc = frames[i].contentDocument;
+            out[frames[i].name] = !!(doc && doc.body);
+        }
+        return out;
+    """
+
+    # Regex pattern for kernel version (compiled once, searched on every page read).
+    # Digit runs are bounded so candidate matches in long page text fail fast;
+    # [._] stays because EL releases use '_' (e.g. el9_4).
+    KERNEL_VERSION_PATTERN = re.compile(
+        r"(\d{1,2}\.\d{1,3}\.\d{1,3}-\d{1,4}\.\d{1,3}\.\d{1,3}\.el\d{1,2}[._]\d{1,3}\.x86_64)"
+    )
+
+    # Any of these (case-insensitive) marks the System Updates content as loaded
+    PAGE_KEYWORDS_PATTERN = re.compile(r"system update|kernel|version", re.IGNORECASE)
 
     def __init__(self, driver: WebDriver):
         """
@@ -119,11 +150,36 @@ class SystemUpdatePage(BasePage):
             return
 
         # Step 5: Wait for content to load in right frame
+        # (click_link_in_frame has already switched back to default content)
         time.sleep(2)  # Allow page to load in right frame
-        self.switch_to_default_content()
 
         self.logger.info("✓ Navigated to System Updates page via menu navigation")
 
+    def is_current_page(self) -> bool:
+        """
+        Check whether the right frame already shows the System Updates page.
+
+        Reads the frame location with a single script call, so callers can
+        skip the menu navigation (and its fixed sleeps) when it is redundant.
+
+        Returns:
+            bool: True if System Updates is loaded in the right frame
+
+        Example:
+            >>> if not system_update_page.is_current_page():
+            ...     system_update_page.navigate()
+        """
+        try:
+            frame_url = self.driver.execute_script(
+                "var f = window.frames[arguments[0]]; return f ? f.location.pathname : null;",
+                self.RIGHT_FRAME,
+            )
+        except Exception as e:
+            self.logger.debug(f"Unable to read right frame location: {e}")
+            return False
+
+        return bool(frame_url) and frame_url.endswith(self.PAGE_DOCUMENT)
+
     # ==================== Information Retrieval ====================
 
     def get_page_content(self) -> Optional[str]:
@@ -167,18 +223,22 @@ class SystemUpdatePage(BasePage):
         TestLogger.log_step("Extract kernel version from page")
 
         try:
-            # Get page content from right frame
-            content = self.get_page_content()
+            # Targeted read: only the kernel element's text crosses the wire
+            content = self._read_kernel_element() if TestConfig.KERNEL_VERSION_SELECTOR else None
+            kernel_version = self.extract_kernel_version(content) if content else None
 
-            if not content:
-                self.logger.error("✗ Page content is empty")
-                return None
+            if not kernel_version:
+                # Fallback: get full page content from right frame
+                content = self.get_page_content()
 
-            # Extract kernel version using regex
-            match = re.search(self.KERNEL_VERSION_PATTERN, content)
+                if not content:
+                    self.logger.error("✗ Page content is empty")
+                    return None
 
-            if match:
-                kernel_version = match.group(1)
+                # Extract kernel version using regex
+                kernel_version = self.extract_kernel_version(content)
+
+            if kernel_version:
                 self.logger.info(f"✓ Kernel version extracted: {kernel_version}")
                 TestLogger.log_verification(
                     "Kernel version extraction", "Version found", kernel_version, True
@@ -194,6 +254,52 @@ class SystemUpdatePage(BasePage):
             TestLogger.log_exception(e, "Kernel version extraction failed")
             return None
 
+    def extract_kernel_version(self, content: str, max_scan: int = 4096) -> Optional[str]:
+        """
+        Find the kernel version in page text.
+
+        The version sits in the info panel near the top of the page, so the
+        first max_scan characters are searched first (pos/endpos, no slice copy);
+        the whole text is searched only on a miss.
+
+        Args:
+            content: Page or element text
+            max_scan: Number of leading characters to search first
+
+        Returns:
+            str: Kernel version, or None if not found
+
+        Example:
+            >>> system_update_page.extract_kernel_version("Kernel: 5.14.0-427.24.1.el9_4.x86_64")
+            '5.14.0-427.24.1.el9_4.x86_64'
+        """
+        match = self.KERNEL_VERSION_PATTERN.search(content, 0, max_scan)
+        if match is None and len(content) > max_scan:
+            # Full rescan also catches a version straddling the max_scan boundary
+            match = self.KERNEL_VERSION_PATTERN.search(content)
+        return match.group(1) if match else None
+
+    def _read_kernel_element(self) -> Optional[str]:
+        """
+        Read the text of the element matched by TestConfig.KERNEL_VERSION_SELECTOR.
+
+        Returns:
+            str: Element text content, or None if the element is not found
+        """
+        if not self.switch_to_frame(self.RIGHT_FRAME):
+            return None
+
+        try:
+            return self.driver.execute_script(
+                "var el = document.querySelector(arguments[0]); return el ? el.textContent : null;",
+                TestConfig.KERNEL_VERSION_SELECTOR,
+            )
+        except Exception as e:
+            self.logger.debug(f"Kernel selector read failed, using page content: {e}")
+            return None
+        finally:
+            self.switch_to_default_content()
+
     def verify_kernel_version(self, expected_version: str) -> bool:
         """
         Verify displayed kernel version matches expected version.
@@ -257,8 +363,7 @@ class SystemUpdatePage(BasePage):
                 return title
 
             # Fallback: check if "System Update" is in page content
-            body = self.find_element(*self.PAGE_BODY)
-            if body and "System Update" in body.text:
+            if self.body_contains_text("System Update"):
                 self.logger.info("✓ Found 'System Update' in page content")
                 return "System Update"
 
@@ -298,16 +403,15 @@ class SystemUpdatePage(BasePage):
                 self.logger.error("✗ Page content is empty")
                 return False
 
-            # Check for expected text
-            expected_keywords = ["system update", "kernel", "version"]
+            # Check for expected text (one case-insensitive scan, no lowercased copy)
+            match = self.PAGE_KEYWORDS_PATTERN.search(content)
 
-            for keyword in expected_keywords:
-                if keyword.lower() in content.lower():
-                    self.logger.debug(f"✓ Found keyword: {keyword}")
-                    TestLogger.log_verification(
-                        "Page content", "Contains expected keywords", "Keywords found", True
-                    )
-                    return True
+            if match:
+                self.logger.debug(f"✓ Found keyword: {match.group(0)}")
+                TestLogger.log_verification(
+                    "Page content", "Contains expected keywords", "Keywords found", True
+                )
+                return True
 
             self.logger.warning("✗ Expected keywords not found in page")
             return False
@@ -373,23 +477,22 @@ class SystemUpdatePage(BasePage):
         try:
             self.switch_to_default_content()
 
-            # Find all frames
-            frames = self.find_elements(By.TAG_NAME, "frame")
-            frame_count = len(frames)
+            # Frame names in one round trip (waits, like find_elements, until frames exist)
+            frame_names = self.frame_wait.until(lambda d: d.execute_script(self.FRAME_NAMES_SCRIPT))
+            frame_count = len(frame_names)
 
             if frame_count != 3:
                 self.logger.error(f"✗ Expected 3 frames, found {frame_count}")
                 TestLogger.log_verification("Frame count", "3", str(frame_count), False)
                 return False
 
-            # Verify frame names
-            frame_names = [f.get_attribute("name") for f in frames]
-            expected_frames = ["tophead", "left", "right"]
+            # Verify frame names (all missing frames reported at once)
+            missing_frames = self.REQUIRED_FRAMES.difference(frame_names)
 
-            for expected_frame in expected_frames:
-                if expected_frame not in frame_names:
-                    self.logger.error(f"✗ Expected frame '{expected_frame}' not found")
-                    return False
+            if missing_frames:
+                self.logger.error(f"✗ Expected frames not found: {sorted(missing_frames)}")
+                self.logger.error(f"  Frames found: {frame_names}")
+                return False
 
             self.logger.info("✓ Frame structure validation passed")
             self.logger.info(f"  Frames found: {frame_names}")
@@ -408,12 +511,37 @@ class SystemUpdatePage(BasePage):
             TestLogger.log_exception(e, "Frame structure verification failed")
             return False
 
-    def is_frame_accessible(self, frame_name: str) -> bool:
+    def get_frame_accessibility(self) -> dict[str, bool]:
+        """
+        Check every top-level frame for an accessible body in one script call.
+
+        Replaces a switch / find body / switch back sequence per frame with a
+        single round trip. A frame whose document cannot be read (not loaded
+        yet, or cross-origin) is reported as inaccessible.
+
+        Returns:
+            dict: Frame name -> True if the frame document has a body
+
+        Example:
+            >>> system_update_page.get_frame_accessibility()
+            {'tophead': True, 'left': True, 'right': True}
+        """
+        try:
+            return self.driver.execute_script(self.FRAME_ACCESSIBILITY_SCRIPT) or {}
+        except Exception as e:
+            self.logger.error(f"✗ Unable to check frame accessibility: {e}")
+            return {}
+
+    def is_frame_accessible(self, frame_name: str, timeout: int = 5) -> bool:
         """
         Check if specified frame is accessible.
 
+        Polls get_frame_accessibility (one script call per poll) so a frame
+        that is still loading gets up to timeout seconds to expose its body.
+
         Args:
             frame_name: Name of frame to check
+            timeout: Maximum wait time in seconds
 
         Returns:
             bool: True if frame is accessible, False otherwise
@@ -422,26 +550,17 @@ class SystemUpdatePage(BasePage):
             >>> if system_update_page.is_frame_accessible('right'):
             ...     print("Right frame is accessible")
         """
-        try:
-            if not self.switch_to_frame(frame_name):
-                return False
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=TestConfig.FRAME_POLL_FREQUENCY)
 
-            # Try to access frame body
-            body = self.find_element(*self.PAGE_BODY, timeout=5)
-
-            if body:
-                self.logger.debug(f"✓ Frame '{frame_name}' is accessible")
-                return True
-
-            return False
+        try:
+            wait.until(lambda d: self.get_frame_accessibility().get(frame_name))
+            self.logger.debug(f"✓ Frame '{frame_name}' is accessible")
+            return True
 
-        except Exception:
+        except TimeoutException:
             self.logger.error(f"✗ Frame '{frame_name}' is not accessible")
             return False
 
-        finally:
-            self.switch_to_default_content()
-
     # ==================== Utility Methods ====================
 
     def capture_page_snapshot(self) -> dict[str, str]:
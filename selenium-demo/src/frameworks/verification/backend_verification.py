@@ -9,10 +9,13 @@ Author: QA Automation Team
 Version: 1.0.0
 """
 
+import re
+import threading
+import time
 from typing import Any, Optional
 
 from core.config.test_config import TestConfig
-from core.helpers.ssh_helper import create_ssh_helper
+from core.helpers.ssh_helper import SSHConnectionPool, create_ssh_helper
 from core.logging.test_logger import get_logger
 
 logger = get_logger(__name__)
@@ -70,7 +73,32 @@ class BackendVerification:
         "TMUFEENG": "/var/iwss/updates/locks/tmufeeng.lock",
     }
 
-    def __init__(self, ssh_config: dict[str, Any]):
+    # Sentinel echoed between sections of a batched remote command
+    SECTION_MARKER = "---SECTION:{}---"
+    SECTION_MARKER_PATTERN = re.compile(r"^---SECTION:(\w+)---$")
+    EXIT_MARKER = "---EXIT:{}---"
+    EXIT_MARKER_PATTERN = re.compile(r"^---EXIT:(\d+)---$")
+
+    # Commands bundled by get_health_bundle (one SSH exec)
+    HEALTH_COMMANDS = {
+        "kernel_version": "uname -r",
+        "service_state": "systemctl is-active iwss",
+        "hostname": "hostname",
+        "uptime": "uptime -p",
+    }
+
+    # Commands bundled by get_system_info_bulk (one SSH exec)
+    SYSTEM_INFO_COMMANDS = {
+        "kernel_version": "uname -r",
+        "os_version": "cat /etc/redhat-release",
+        "hostname": "hostname",
+        "uptime": "uptime -p",
+        "current_time": "date",
+        "service_state": "systemctl is-active iwss",
+        "service_status": "systemctl status iwss --no-pager",
+    }
+
+    def __init__(self, ssh_config: dict[str, Any], use_pool: bool = False):
         """
         Initialize Backend Verification.
 
@@ -80,15 +108,25 @@ class BackendVerification:
                 - port: SSH port
                 - username: SSH username
                 - password: SSH password
+            use_pool: Share a pooled SSH connection (see SSHConnectionPool)
         """
+        self.ssh_config = ssh_config
+        self.use_pool = use_pool
         self.ssh = create_ssh_helper(ssh_config)
         self.connected = False
-        logger.debug("BackendVerification initialized")
+
+        # Parsed INI data cache: (monotonic fetch time, data)
+        self._ini_cache: Optional[tuple[float, dict[str, str]]] = None
+        self._ini_lock = threading.Lock()
+
+        logger.debug(f"BackendVerification initialized (pooled: {use_pool})")
 
     def connect(self) -> bool:
         """
         Establish SSH connection to IWSVA server.
 
+        With use_pool, an existing pooled connection is reused when available.
+
         Returns:
             bool: True if connection successful
 
@@ -96,7 +134,11 @@ class BackendVerification:
             Exception: If SSH connection fails
         """
         try:
-            self.connected = self.ssh.connect()
+            if self.use_pool:
+                self.ssh = SSHConnectionPool.acquire(self.ssh_config)
+                self.connected = True
+            else:
+                self.connected = self.ssh.connect()
             logger.info("✓ Backend verification connection established")
             return self.connected
         except Exception as e:
@@ -104,8 +146,9 @@ class BackendVerification:
             raise
 
     def disconnect(self) -> None:
-        """Close SSH connection."""
-        self.ssh.disconnect()
+        """Close SSH connection (pooled connections stay open for other users)."""
+        if not self.use_pool:
+            self.ssh.disconnect()
         self.connected = False
         logger.info("✓ Backend verification connection closed")
 
@@ -229,12 +272,64 @@ class BackendVerification:
         logger.debug(f"✓ INI file parsed ({len(ini_data)} entries)")
         return ini_data
 
-    def get_component_version_from_ini(self, component_id: str) -> Optional[str]:
+    def get_ini_data(self, max_age: float = 0.0) -> dict[str, str]:
+        """
+        Get parsed INI file data, reusing a cached copy younger than max_age.
+
+        Concurrent callers share a single fetch, so a parallel batch reads
+        the INI file over SSH once.
+
+        Args:
+            max_age: Maximum cache age in seconds (default: 0, always fetch)
+
+        Returns:
+            dict: Parsed INI data (key: value)
+
+        Example:
+            >>> data = verifier.get_ini_data(max_age=5.0)
+            >>> ptn_version = data.get('PTNVersion')
+        """
+        with self._ini_lock:
+            if self._ini_cache and time.monotonic() - self._ini_cache[0] < max_age:
+                logger.debug("✓ Using cached INI data")
+                return self._ini_cache[1]
+
+            ini_data = self.parse_ini_file(self.get_ini_file_content())
+            self._ini_cache = (time.monotonic(), ini_data)
+            return ini_data
+
+    def get_ini_mtime(self, ini_path: str = None) -> Optional[float]:
+        """
+        Get modification time of INI configuration file.
+
+        A single SFTP stat - much cheaper than reading and parsing the file,
+        so callers can use it to detect whether versions may have changed.
+
+        Args:
+            ini_path: Path to INI file (default: from TestConfig)
+
+        Returns:
+            float: Remote mtime (epoch seconds) or None if unavailable
+
+        Example:
+            >>> mtime = verifier.get_ini_mtime()
+            >>> changed = mtime != last_seen_mtime
+        """
+        if ini_path is None:
+            ini_path = TestConfig.BACKEND_PATHS["ini_file"]
+
+        info = self.ssh.get_file_info(ini_path)
+        return info["mtime"] if info else None
+
+    def get_component_version_from_ini(
+        self, component_id: str, max_age: float = 0.0
+    ) -> Optional[str]:
         """
         Get component version from INI file.
 
         Args:
             component_id: Component ID (e.g., 'PTN', 'ENG', 'SPYWARE')
+            max_age: Accept cached INI data up to this age in seconds (default: 0)
 
         Returns:
             str: Component version or None if not found
@@ -253,8 +348,7 @@ class BackendVerification:
 
         try:
             # Read and parse INI file
-            ini_content = self.get_ini_file_content()
-            ini_data = self.parse_ini_file(ini_content)
+            ini_data = self.get_ini_data(max_age=max_age)
 
             # Get version
             version = ini_data.get(ini_key)
@@ -362,9 +456,7 @@ class BackendVerification:
         """
         logger.info(f"Waiting for {component_id} lock file removal (timeout: {timeout}s)")
 
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
         elapsed = 0
 
         while elapsed < timeout:
@@ -373,7 +465,7 @@ class BackendVerification:
                 return True
 
             time.sleep(check_interval)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             if elapsed % 30 == 0:  # Log every 30 seconds
                 logger.info(f"Still waiting for {component_id} update... ({int(elapsed)}s elapsed)")
@@ -517,6 +609,136 @@ class BackendVerification:
             logger.error(f"✗ Failed to get system info: {e}")
             raise
 
+    def get_system_info_bulk(self) -> dict[str, Any]:
+        """
+        Get system information and IWSS service status in one SSH call.
+
+        Combines get_system_info, is_iwss_service_running and
+        get_iwss_service_status into a single remote shell invocation.
+
+        Returns:
+            dict: Bulk results with keys:
+                - system_info: Same fields as get_system_info()
+                - is_running: True if IWSS service is active
+                - service_status: Same shape as get_iwss_service_status()
+
+        Raises:
+            RuntimeError: If any get_system_info() field fails or is empty
+
+        Example:
+            >>> bulk = verifier.get_system_info_bulk()
+            >>> print(f"OS: {bulk['system_info']['os_version']}")
+            >>> assert bulk['is_running']
+        """
+        logger.info("Getting system information and IWSS status (bulk)")
+
+        sections, exit_codes = self._execute_sections(self.SYSTEM_INFO_COMMANDS)
+
+        system_info = {
+            name: sections[name]
+            for name in ("kernel_version", "os_version", "hostname", "uptime", "current_time")
+        }
+
+        # Same contract as get_system_info: a failed field is an error, not ''
+        failed = [
+            f"{name} (exit code {exit_codes[name]})"
+            for name, value in system_info.items()
+            if exit_codes[name] != 0 or not value
+        ]
+        if failed:
+            logger.error(f"✗ Failed to get system info: {', '.join(failed)}")
+            raise RuntimeError(f"Failed to get system info: {', '.join(failed)}")
+
+        is_running = sections["service_state"] == "active"
+
+        service_status = {
+            "service": "iwss",
+            "is_running": is_running,
+            "status_output": sections["service_status"],
+            "exit_code": exit_codes["service_status"],
+        }
+
+        logger.info(
+            f"✓ System info retrieved: {system_info['hostname']} ({system_info['os_version']}), "
+            f"iwss={sections['service_state']}"
+        )
+        return {
+            "system_info": system_info,
+            "is_running": is_running,
+            "service_status": service_status,
+        }
+
+    def get_health_bundle(self) -> dict[str, Any]:
+        """
+        Get kernel version, IWSS service state, hostname and uptime in one SSH call.
+
+        Returns:
+            dict: Raw section output keyed by HEALTH_COMMANDS names
+                (empty string if a section produced no output), plus
+                'exit_codes' mapping each section name to its exit code
+
+        Example:
+            >>> bundle = verifier.get_health_bundle()
+            >>> is_running = bundle['service_state'] == 'active'
+            >>> kernel_ok = bundle['exit_codes']['kernel_version'] == 0
+        """
+        logger.info("Getting system health bundle")
+
+        sections, exit_codes = self._execute_sections(self.HEALTH_COMMANDS)
+        bundle: dict[str, Any] = {**sections, "exit_codes": exit_codes}
+
+        logger.info(
+            f"✓ Health bundle retrieved: kernel={bundle['kernel_version']}, "
+            f"iwss={bundle['service_state']}"
+        )
+        return bundle
+
+    def _execute_sections(self, commands: dict[str, str]) -> tuple[dict[str, str], dict[str, int]]:
+        """
+        Run several commands in a single remote shell and split output by section.
+
+        Each command's stderr is discarded and its exit code is echoed after
+        its output, so one failing section does not affect the others but
+        still reports its own failure.
+
+        Args:
+            commands: Mapping of section name to shell command
+
+        Returns:
+            tuple: (outputs, exit_codes) where outputs maps each section name to
+                its stripped stdout ('' if missing) and exit_codes maps it to the
+                command's exit code (-1 if the section never reported one)
+
+        Example:
+            >>> outputs, codes = verifier._execute_sections({"kernel": "uname -r"})
+            >>> assert codes["kernel"] == 0
+        """
+        script = "; ".join(
+            f"echo '{self.SECTION_MARKER.format(name)}'; {{ {command}; }} 2>/dev/null; "
+            f"echo \"{self.EXIT_MARKER.format('$?')}\""
+            for name, command in commands.items()
+        )
+        stdout, _, _ = self.ssh.execute_command(script)
+
+        sections: dict[str, list[str]] = {name: [] for name in commands}
+        exit_codes = {name: -1 for name in commands}
+        current = None
+
+        for line in stdout.split("\n"):
+            marker = self.SECTION_MARKER_PATTERN.match(line.strip())
+            exit_marker = self.EXIT_MARKER_PATTERN.match(line.strip())
+            if marker:
+                current = marker.group(1)
+            elif exit_marker:
+                if current in exit_codes:
+                    exit_codes[current] = int(exit_marker.group(1))
+                current = None
+            elif current in sections:
+                sections[current].append(line)
+
+        outputs = {name: "\n".join(lines).strip() for name, lines in sections.items()}
+        return outputs, exit_codes
+
     # ==================== Context Manager ====================
 
     def __enter__(self):
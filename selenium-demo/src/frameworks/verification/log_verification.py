@@ -8,8 +8,11 @@ Author: QA Automation Team
 Version: 1.0.0
 """
 
+import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from typing import Any, Optional
 
 from core.helpers.ssh_helper import SSHHelper
@@ -52,6 +55,14 @@ class LogVerification:
         "success": r"SUCCESS|success|completed successfully",
     }
 
+    # Single-pass classifier: the matching named group is the line's category
+    LINE_CLASSIFIER = re.compile(
+        f"(?P<error>{PATTERNS['error']})"
+        f"|(?P<warning>{PATTERNS['warning']})"
+        f"|(?P<success>{PATTERNS['success']})",
+        re.IGNORECASE,
+    )
+
     # Component-specific success messages
     COMPONENT_SUCCESS_PATTERNS = {
         "PTN": r"PTN.*update.*success|Pattern.*update.*complete",
@@ -141,15 +152,18 @@ class LogVerification:
 
     # ==================== Pattern Matching ====================
 
-    def search_pattern(
+    def iter_matches(
         self,
         pattern: str,
         log_content: Optional[str] = None,
         max_lines: int = 1000,
         case_sensitive: bool = False,
-    ) -> list[str]:
+    ) -> Iterator[str]:
         """
-        Search for pattern in log content.
+        Lazily yield log lines matching pattern.
+
+        Lines are produced as they are found, so consumers that only need the
+        first few matches stop scanning early without building a full list.
 
         Args:
             pattern: Regex pattern to search
@@ -157,30 +171,59 @@ class LogVerification:
             max_lines: Maximum lines to search if reading from file
             case_sensitive: Case-sensitive search (default: False)
 
-        Returns:
-            list: Matching log lines
+        Yields:
+            str: Matching log lines (stripped)
 
         Example:
-            >>> errors = log_verifier.search_pattern('ERROR|FAIL')
+            >>> first_errors = list(islice(log_verifier.iter_matches('ERROR'), 10))
         """
-        logger.info(f"Searching log for pattern: '{pattern}'")
-
         if log_content is None:
             log_content = self.get_log_tail(max_lines)
 
         flags = 0 if case_sensitive else re.IGNORECASE
         regex = re.compile(pattern, flags)
 
-        matches = []
+        # Matched line by line so patterns like \s or [^x] never span a line break
         for line in log_content.split("\n"):
             if regex.search(line):
-                matches.append(line.strip())
+                yield line.strip()
+
+    def search_pattern(
+        self,
+        pattern: str,
+        log_content: Optional[str] = None,
+        max_lines: int = 1000,
+        case_sensitive: bool = False,
+        limit: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Search for pattern in log content.
+
+        Args:
+            pattern: Regex pattern to search
+            log_content: Log content to search (if None, reads from file)
+            max_lines: Maximum lines to search if reading from file
+            case_sensitive: Case-sensitive search (default: False)
+            limit: Stop after this many matching lines (default: None, all)
+
+        Returns:
+            list: Matching log lines
+
+        Example:
+            >>> errors = log_verifier.search_pattern('ERROR|FAIL')
+            >>> first_ten = log_verifier.search_pattern('success|completed', limit=10)
+        """
+        logger.info(f"Searching log for pattern: '{pattern}'")
+
+        matches = list(
+            islice(self.iter_matches(pattern, log_content, max_lines, case_sensitive), limit)
+        )
 
         logger.info(f"✓ Found {len(matches)} matching lines")
         return matches
 
     def find_errors_in_log(
-        self, log_content: Optional[str] = None, max_lines: int = 1000
+        self, log_content: Optional[str] = None, max_lines: int = 1000, limit: Optional[int] = None
     ) -> list[str]:
         """
         Find error messages in log.
@@ -188,6 +231,7 @@ class LogVerification:
         Args:
             log_content: Log content to search
             max_lines: Maximum lines to search
+            limit: Stop after this many error lines (default: None, all)
 
         Returns:
             list: Error log lines
@@ -199,7 +243,7 @@ class LogVerification:
         logger.info("Searching for errors in log")
 
         error_pattern = self.PATTERNS["error"]
-        errors = self.search_pattern(error_pattern, log_content, max_lines)
+        errors = self.search_pattern(error_pattern, log_content, max_lines, limit=limit)
 
         if errors:
             logger.warning(f"✗ Found {len(errors)} error lines in log")
@@ -211,7 +255,7 @@ class LogVerification:
         return errors
 
     def find_warnings_in_log(
-        self, log_content: Optional[str] = None, max_lines: int = 1000
+        self, log_content: Optional[str] = None, max_lines: int = 1000, limit: Optional[int] = None
     ) -> list[str]:
         """
         Find warning messages in log.
@@ -219,6 +263,7 @@ class LogVerification:
         Args:
             log_content: Log content to search
             max_lines: Maximum lines to search
+            limit: Stop after this many warning lines (default: None, all)
 
         Returns:
             list: Warning log lines
@@ -226,7 +271,7 @@ class LogVerification:
         logger.info("Searching for warnings in log")
 
         warning_pattern = self.PATTERNS["warning"]
-        warnings = self.search_pattern(warning_pattern, log_content, max_lines)
+        warnings = self.search_pattern(warning_pattern, log_content, max_lines, limit=limit)
 
         if warnings:
             logger.info(f"Found {len(warnings)} warning lines in log")
@@ -235,6 +280,61 @@ class LogVerification:
 
         return warnings
 
+    def classify(
+        self,
+        log_content: Optional[str] = None,
+        patterns: Optional[dict[str, str]] = None,
+        max_lines: int = 1000,
+    ) -> dict[str, list[str]]:
+        """
+        Bucket log lines by category in one regex pass.
+
+        All category patterns are fused into one compiled alternation of named
+        groups, so each line is scanned once however many categories are
+        requested. A line matching several categories appears in each bucket.
+
+        Args:
+            log_content: Log content to classify (if None, reads from file)
+            patterns: Category name -> regex (names must be valid identifiers).
+                Defaults to the error/warning/success PATTERNS.
+            max_lines: Maximum lines to read if reading from file
+
+        Returns:
+            dict: Matching lines keyed by category name
+
+        Example:
+            >>> buckets = log_verifier.classify()
+            >>> assert not buckets['error'], buckets['error']
+            >>> buckets = log_verifier.classify(log, {'success': 'success', 'warn': 'WARN'})
+        """
+        if log_content is None:
+            log_content = self.get_log_tail(max_lines)
+
+        if patterns is None:
+            regex = self.LINE_CLASSIFIER
+            categories = ["error", "warning", "success"]
+        else:
+            regex = re.compile(
+                "|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns.items()),
+                re.IGNORECASE,
+            )
+            categories = list(patterns)
+
+        buckets: dict[str, list[str]] = {category: [] for category in categories}
+
+        # Matched line by line so no pattern can span a line break
+        for line in log_content.split("\n"):
+            # Several matches on one line count once per category
+            for category in dict.fromkeys(m.lastgroup for m in regex.finditer(line)):
+                buckets[category].append(line.strip())
+
+        if logger.isEnabledFor(logging.DEBUG):  # summary is only built when it will be logged
+            logger.debug(
+                "✓ Classified log: %s",
+                ", ".join(f"{len(lines)} {category}" for category, lines in buckets.items()),
+            )
+        return buckets
+
     # ==================== Update Verification ====================
 
     def verify_update_success(
@@ -496,8 +596,14 @@ class LogVerification:
         if log_content is None:
             log_content = self.get_log_tail(max_lines)
 
-        errors = self.find_errors_in_log(log_content)
-        warnings = self.find_warnings_in_log(log_content)
+        buckets = self.classify(log_content)
+        errors = buckets["error"]
+        warnings = buckets["warning"]
+
+        if errors:
+            logger.warning(f"✗ Found {len(errors)} error lines in log")
+            for error in errors[:5]:  # Log first 5 errors
+                logger.warning(f"  ERROR: {error}")
 
         summary = {
             "total_lines": len(log_content.split("\n")),
@@ -150,7 +150,7 @@ class RollbackWorkflow:
             "duration": 0,
         }
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Step 1: Validate rollback support
@@ -210,7 +210,7 @@ class RollbackWorkflow:
                         logger.info(f"Version rolled back: {pre_version} → {post_version}")
 
             # Calculate duration
-            result["duration"] = time.time() - start_time
+            result["duration"] = time.perf_counter() - start_time
             result["end_time"] = datetime.now().isoformat()
 
             # Overall success
@@ -226,7 +226,7 @@ class RollbackWorkflow:
             result["success"] = False
             result["message"] = str(e)
             result["error"] = str(e)
-            result["duration"] = time.time() - start_time
+            result["duration"] = time.perf_counter() - start_time
 
             logger.error("=" * 80)
             logger.error(f"✗ ROLLBACK NOT SUPPORTED: {component_id}")
@@ -237,7 +237,7 @@ class RollbackWorkflow:
             result["success"] = False
             result["message"] = f"Rollback failed: {str(e)}"
             result["error"] = str(e)
-            result["duration"] = time.time() - start_time
+            result["duration"] = time.perf_counter() - start_time
 
             logger.error("=" * 80)
             logger.error(f"✗ ROLLBACK FAILED: {component_id}")
@@ -136,7 +136,7 @@ class UpdateWorkflow:
             "duration": 0,
         }
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Step 1: Pre-update verification
@@ -202,7 +202,7 @@ class UpdateWorkflow:
                 result["log_verification"] = log_result
 
             # Calculate duration
-            result["duration"] = time.time() - start_time
+            result["duration"] = time.perf_counter() - start_time
             result["end_time"] = datetime.now().isoformat()
 
             # Overall success
@@ -217,7 +217,7 @@ class UpdateWorkflow:
             result["success"] = False
             result["message"] = f"Update failed: {str(e)}"
             result["error"] = str(e)
-            result["duration"] = time.time() - start_time
+            result["duration"] = time.perf_counter() - start_time
 
             logger.error("=" * 80)
             logger.error(f"✗ UPDATE FAILED: {component_id}")
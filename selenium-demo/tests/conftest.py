@@ -12,23 +12,23 @@ Author: QA Automation Team
 Version: 1.0.0
 """
 
+import copy
+import functools
 import os
+import re
+import threading
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Optional
 
 import allure
 import pytest
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-
-from core.config.test_config import TestConfig
+
+from core.config.test_config import LOGS_DIR, XDIST_WORKER, TestConfig
 from core.debugging.debug_helper import DebugHelper
-from core.helpers.ssh_helper import create_ssh_helper
+from core.helpers.ssh_helper import SSHConnectionPool
 from core.logging.test_logger import get_logger
 from frameworks.pages.login_page import LoginPage
 from frameworks.pages.system_update_page import SystemUpdatePage
@@ -42,6 +42,57 @@ logger = get_logger(__name__)
 # ==================== Session-Level Fixtures ====================
 
 
+def _start_driver_binary_prefetch() -> Optional[threading.Thread]:
+    """
+    Resolve the WebDriver binary in a background thread.
+
+    Started from pytest_configure, so the webdriver-manager lookup overlaps
+    plugin loading, collection and session setup instead of stalling the
+    first driver. Fills the memoized _resolve_chromedriver/_resolve_geckodriver
+    cache. Skipped when an explicit driver path is set.
+
+    Returns:
+        Thread doing the lookup, or None if nothing needs resolving
+    """
+    browser = TestConfig.BROWSER.lower()
+    if browser == "chrome" and not TestConfig.CHROMEDRIVER_PATH:
+        resolve, version = _resolve_chromedriver, TestConfig.CHROMEDRIVER_VERSION
+    elif browser == "firefox" and not TestConfig.GECKODRIVER_PATH:
+        resolve, version = _resolve_geckodriver, TestConfig.GECKODRIVER_VERSION
+    else:
+        return None
+
+    def prefetch() -> None:
+        try:
+            # Same call shape as the factories so the functools.cache key matches
+            if version:
+                resolve(version)
+            else:
+                resolve()
+        except Exception as e:
+            # Not cached on failure - the factory retries and reports it
+            logger.warning(f"✗ Background driver resolution failed: {e}")
+
+    thread = threading.Thread(target=prefetch, name="driver-prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
+# Background lookup thread started by pytest_configure (absent if not started)
+_PREFETCH_KEY = pytest.StashKey[Optional[threading.Thread]]()
+
+
+@pytest.fixture(scope="session")
+def _driver_binary_prefetch(pytestconfig) -> Optional[threading.Thread]:
+    """
+    Background WebDriver binary lookup started at configure time.
+
+    Returns:
+        Thread doing the lookup, or None if nothing is being resolved
+    """
+    return pytestconfig.stash.get(_PREFETCH_KEY, None)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def test_session_setup():
     """
@@ -54,6 +105,8 @@ def test_session_setup():
     """
     logger.info("=" * 80)
     logger.info("TEST SESSION STARTED")
+    if XDIST_WORKER:
+        logger.info(f"xdist worker: {XDIST_WORKER} (logs: {LOGS_DIR})")
     logger.info("=" * 80)
 
     # Validate configuration
@@ -83,12 +136,12 @@ def test_session_setup():
 # ==================== WebDriver Fixture ====================
 
 
-@pytest.fixture(scope="function")
-def driver() -> Generator[webdriver.Remote, None, None]:
+@pytest.fixture(scope="session")
+def _session_driver(_driver_binary_prefetch) -> Generator[webdriver.Remote, None, None]:
     """
-    WebDriver fixture - creates and manages browser instance.
+    Session WebDriver - creates and manages the browser instance.
 
-    Scope: function (new driver for each test)
+    Scope: session (one browser per session/xdist worker; tests use `driver`)
 
     Provides:
     - Browser initialization based on TestConfig.BROWSER
@@ -96,6 +149,11 @@ def driver() -> Generator[webdriver.Remote, None, None]:
     - Browser options configuration (SSL, headless, etc.)
     - Automatic cleanup after test
 
+    Note:
+        Implicit wait is 0. Page objects must wait explicitly
+        (BasePage.find_element / WebDriverWait) rather than rely on
+        driver.find_element polling.
+
     Yields:
         WebDriver: Configured WebDriver instance
 
@@ -110,6 +168,10 @@ def driver() -> Generator[webdriver.Remote, None, None]:
 
     driver_instance = None
 
+    # Let the background lookup finish rather than racing it on the driver cache
+    if _driver_binary_prefetch is not None:
+        _driver_binary_prefetch.join()
+
     try:
         # Initialize driver based on browser choice
         if TestConfig.BROWSER.lower() == "chrome":
@@ -120,10 +182,10 @@ def driver() -> Generator[webdriver.Remote, None, None]:
             raise ValueError(f"Unsupported browser: {TestConfig.BROWSER}")
 
         # Configure driver
-        driver_instance.maximize_window()
         driver_instance.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
         driver_instance.set_script_timeout(TestConfig.SCRIPT_TIMEOUT)
-        driver_instance.implicitly_wait(TestConfig.IMPLICIT_WAIT)
+        # No implicit wait - it would stall every missing-element probe
+        driver_instance.implicitly_wait(0)
 
         logger.info("✓ WebDriver initialized successfully")
         logger.info(f"  Browser: {TestConfig.BROWSER}")
@@ -147,6 +209,53 @@ def driver() -> Generator[webdriver.Remote, None, None]:
                 logger.error(f"✗ Error closing WebDriver: {e}")
 
 
+@pytest.fixture(scope="function")
+def driver(_session_driver) -> Generator[webdriver.Remote, None, None]:
+    """
+    WebDriver fixture - per-test view of the session browser.
+
+    Scope: function (shared browser, state reset after each test)
+
+    Reset after each test:
+    - localStorage / sessionStorage cleared
+    - Cookies deleted (next test logs in again)
+    - Browser parked on about:blank
+
+    Args:
+        _session_driver: Session WebDriver fixture
+
+    Yields:
+        WebDriver: Configured WebDriver instance
+
+    Example:
+        >>> def test_example(driver):
+        ...     driver.get('https://example.com')
+        ...     assert 'Example' in driver.title
+    """
+    yield _session_driver
+
+    _reset_driver_state(_session_driver)
+
+
+def _reset_driver_state(driver_instance: webdriver.Remote) -> None:
+    """
+    Reset browser state between tests so a shared driver behaves like a fresh one.
+
+    Args:
+        driver_instance: WebDriver to reset
+    """
+    try:
+        driver_instance.switch_to.default_content()
+        driver_instance.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver_instance.delete_all_cookies()
+        driver_instance.get("about:blank")
+        logger.debug("✓ WebDriver state reset")
+    except Exception as e:
+        logger.warning(f"✗ Failed to reset WebDriver state: {e}")
+
+
 def _create_chrome_driver() -> webdriver.Chrome:
     """
     Create Chrome WebDriver with intelligent version management.
@@ -162,24 +271,11 @@ def _create_chrome_driver() -> webdriver.Chrome:
     Note:
         Uses 3-tier WebDriver version management for enterprise reliability
     """
-    options = ChromeOptions()
+    # Imported lazily - every xdist worker re-imports conftest at collection
+    from selenium.webdriver.chrome.service import Service as ChromeService
 
-    # Add Chrome options from config
-    for option in TestConfig.CHROME_OPTIONS:
-        options.add_argument(option)
-
-    # Set window size
-    if not TestConfig.HEADLESS:
-        options.add_argument(
-            f"--window-size={TestConfig.BROWSER_WIDTH},{TestConfig.BROWSER_HEIGHT}"
-        )
-
-    # Disable automation flags
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option("useAutomationExtension", False)
-
-    # Enable browser logging (for debug)
-    options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    # Copy so a driver can never mutate the shared template
+    options = copy.deepcopy(_chrome_options_template())
 
     # WebDriver version management (3-tier)
     if TestConfig.CHROMEDRIVER_PATH:
@@ -189,12 +285,12 @@ def _create_chrome_driver() -> webdriver.Chrome:
     elif TestConfig.CHROMEDRIVER_VERSION:
         # Mode 2: Version lock (Development, reproducible)
         logger.info(f"Using ChromeDriver version: {TestConfig.CHROMEDRIVER_VERSION}")
-        driver_path = ChromeDriverManager(driver_version=TestConfig.CHROMEDRIVER_VERSION).install()
+        driver_path = _resolve_chromedriver(TestConfig.CHROMEDRIVER_VERSION)
         service = ChromeService(executable_path=driver_path)
     else:
         # Mode 3: Auto-detect with cache (Fallback)
         logger.info("Auto-detecting ChromeDriver")
-        driver_path = ChromeDriverManager().install()
+        driver_path = _resolve_chromedriver()
         service = ChromeService(executable_path=driver_path)
 
     # Create driver
@@ -204,6 +300,40 @@ def _create_chrome_driver() -> webdriver.Chrome:
     return driver
 
 
+@functools.lru_cache(maxsize=1)
+def _chrome_options_template():
+    """
+    Build Chrome options from TestConfig once per process.
+
+    Returns:
+        ChromeOptions: Shared template - callers must copy before use
+    """
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+    options = ChromeOptions()
+
+    # Add Chrome options from config
+    for option in TestConfig.CHROME_OPTIONS:
+        options.add_argument(option)
+
+    # Set window size at launch (headless too - no maximize_window round-trip)
+    options.add_argument(f"--window-size={TestConfig.BROWSER_WIDTH},{TestConfig.BROWSER_HEIGHT}")
+
+    # Disable automation flags
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+
+    # Skip image decoding - tests assert on text/DOM, not rendering
+    if TestConfig.DISABLE_IMAGES:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+
+    # Enable browser logging (for debug)
+    if TestConfig.CAPTURE_BROWSER_LOGS:
+        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+
+    return options
+
+
 def _create_firefox_driver() -> webdriver.Firefox:
     """
     Create Firefox WebDriver with intelligent version management.
@@ -219,22 +349,9 @@ def _create_firefox_driver() -> webdriver.Firefox:
     Note:
         Uses 3-tier WebDriver version management for enterprise reliability
     """
-    options = FirefoxOptions()
-
-    # Add Firefox options from config
-    for option in TestConfig.FIREFOX_OPTIONS:
-        options.add_argument(option)
-
-    # Set headless mode
-    if TestConfig.HEADLESS:
-        options.add_argument("--headless")
+    from selenium.webdriver.firefox.service import Service as FirefoxService
 
-    # Accept insecure certificates (for IWSVA self-signed cert)
-    options.accept_insecure_certs = True
-
-    # Set window size
-    options.set_preference("browser.window.width", TestConfig.BROWSER_WIDTH)
-    options.set_preference("browser.window.height", TestConfig.BROWSER_HEIGHT)
+    options = copy.deepcopy(_firefox_options_template())
 
     # WebDriver version management (3-tier)
     if TestConfig.GECKODRIVER_PATH:
@@ -244,12 +361,12 @@ def _create_firefox_driver() -> webdriver.Firefox:
     elif TestConfig.GECKODRIVER_VERSION:
         # Mode 2: Version lock (Development, reproducible)
         logger.info(f"Using GeckoDriver version: {TestConfig.GECKODRIVER_VERSION}")
-        driver_path = GeckoDriverManager(driver_version=TestConfig.GECKODRIVER_VERSION).install()
+        driver_path = _resolve_geckodriver(TestConfig.GECKODRIVER_VERSION)
         service = FirefoxService(executable_path=driver_path)
     else:
         # Mode 3: Auto-detect with cache (Fallback)
         logger.info("Auto-detecting GeckoDriver")
-        driver_path = GeckoDriverManager().install()
+        driver_path = _resolve_geckodriver()
         service = FirefoxService(executable_path=driver_path)
 
     # Create driver
@@ -259,21 +376,116 @@ def _create_firefox_driver() -> webdriver.Firefox:
     return driver
 
 
+@functools.lru_cache(maxsize=1)
+def _firefox_options_template():
+    """
+    Build Firefox options from TestConfig once per process.
+
+    Returns:
+        FirefoxOptions: Shared template - callers must copy before use
+    """
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+    options = FirefoxOptions()
+
+    # Add Firefox options from config
+    for option in TestConfig.FIREFOX_OPTIONS:
+        options.add_argument(option)
+
+    # Set headless mode
+    if TestConfig.HEADLESS:
+        options.add_argument("--headless")
+
+    # Accept insecure certificates (for IWSVA self-signed cert)
+    options.accept_insecure_certs = True
+
+    # Set window size at launch (no maximize_window round-trip)
+    options.add_argument(f"--width={TestConfig.BROWSER_WIDTH}")
+    options.add_argument(f"--height={TestConfig.BROWSER_HEIGHT}")
+
+    return options
+
+
+@functools.cache
+def _resolve_chromedriver(version: Optional[str] = None) -> str:
+    """
+    Resolve ChromeDriver binary path once per process.
+
+    webdriver-manager stats its cache (and may hit the network) on every
+    install() call, so the path is memoized per requested version.
+
+    Args:
+        version: ChromeDriver version to pin (None = match installed Chrome)
+
+    Returns:
+        str: Path to ChromeDriver binary
+    """
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager(driver_version=version).install()
+
+
+@functools.cache
+def _resolve_geckodriver(version: Optional[str] = None) -> str:
+    """
+    Resolve GeckoDriver binary path once per process.
+
+    Args:
+        version: GeckoDriver version to pin (None = latest)
+
+    Returns:
+        str: Path to GeckoDriver binary
+    """
+    from webdriver_manager.firefox import GeckoDriverManager
+
+    return GeckoDriverManager(version=version).install()
+
+
 # ==================== Page Object Fixtures ====================
 
 
+@pytest.fixture(scope="session")
+def _session_login_page(_session_driver) -> LoginPage:
+    """
+    Session LoginPage object bound to the session browser.
+
+    Args:
+        _session_driver: Session WebDriver fixture
+
+    Returns:
+        LoginPage: LoginPage object (login itself is handled by `login_page`)
+    """
+    return LoginPage(_session_driver)
+
+
+@pytest.fixture(scope="session")
+def _auth_state() -> dict[str, Any]:
+    """
+    Post-login browser state captured once per session (per xdist worker).
+
+    Holds 'cookies', 'local_storage' (JSON string) and 'url' (landing page)
+    after the first successful form login; empty until then.
+
+    Returns:
+        dict: Mutable auth state shared by login fixtures
+    """
+    return {}
+
+
 @pytest.fixture(scope="function")
-def login_page(driver) -> LoginPage:
+def login_page(driver, _session_login_page, _auth_state) -> LoginPage:
     """
     Login Page fixture.
 
     Provides:
     - Initialized LoginPage object
     - Automatic navigation to login page
-    - Automatic login with configured credentials
+    - Automatic login with configured credentials (session cookies reused after first login)
 
     Args:
         driver: WebDriver fixture
+        _session_login_page: Session LoginPage object
+        _auth_state: Session auth state (filled after login)
 
     Returns:
         LoginPage: Initialized and ready LoginPage object
@@ -282,11 +494,71 @@ def login_page(driver) -> LoginPage:
         >>> def test_login(login_page):
         ...     assert login_page.is_logged_in()
     """
-    logger.debug("Creating LoginPage fixture")
+    page = _session_login_page
+
+    # driver starts each test on about:blank with cookies cleared
+    _ensure_logged_in(driver, page, _auth_state)
 
-    # Create page object
-    page = LoginPage(driver)
+    logger.info("✓ LoginPage fixture ready")
 
+    return page
+
+
+@pytest.fixture(scope="function")
+def authenticated_driver(driver, _session_login_page, _auth_state) -> webdriver.Remote:
+    """
+    Logged-in WebDriver fixture using cookie injection.
+
+    The first test logs in through the form and captures cookies and
+    localStorage; later tests restore them instead of repeating the form
+    login. Falls back to form login if the restored session is rejected.
+
+    Args:
+        driver: WebDriver fixture
+        _session_login_page: Session LoginPage object
+        _auth_state: Session auth state
+
+    Returns:
+        WebDriver: WebDriver with an authenticated IWSVA session
+
+    Example:
+        >>> def test_example(authenticated_driver):
+        ...     page = SystemUpdatePage(authenticated_driver)
+    """
+    _ensure_logged_in(driver, _session_login_page, _auth_state)
+
+    return driver
+
+
+def _ensure_logged_in(driver_instance: webdriver.Remote, page: LoginPage, auth_state: dict) -> None:
+    """
+    Log in by restoring captured auth state, falling back to the login form.
+
+    Args:
+        driver_instance: WebDriver instance
+        page: LoginPage object
+        auth_state: Session auth state (filled by the first form login)
+    """
+    if auth_state and _restore_auth_state(driver_instance, auth_state):
+        if page.is_logged_in():
+            logger.info("✓ Restored authenticated session from cookies")
+            return
+
+        logger.warning("Restored session rejected - falling back to form login")
+        auth_state.clear()
+
+    _form_login(page, driver_instance, auth_state)
+
+
+def _form_login(page: LoginPage, driver_instance: webdriver.Remote, auth_state: dict) -> None:
+    """
+    Log in through the login form and capture the resulting auth state.
+
+    Args:
+        page: LoginPage object
+        driver_instance: WebDriver instance
+        auth_state: Session auth state to fill
+    """
     # Navigate to login page
     page.navigate()
 
@@ -297,24 +569,58 @@ def login_page(driver) -> LoginPage:
         logger.error("✗ Login failed during fixture setup")
         pytest.fail("Login failed - cannot proceed with test")
 
-    logger.info("✓ LoginPage fixture ready")
+    auth_state["cookies"] = driver_instance.get_cookies()
+    auth_state["local_storage"] = driver_instance.execute_script(
+        "try { return JSON.stringify(window.localStorage); } catch (e) { return '{}'; }"
+    )
+    auth_state["url"] = driver_instance.current_url
+    logger.debug(f"✓ Captured auth state ({len(auth_state['cookies'])} cookies)")
 
-    return page
+
+def _restore_auth_state(driver_instance: webdriver.Remote, auth_state: dict) -> bool:
+    """
+    Restore captured cookies and localStorage, then load the post-login page.
+
+    Args:
+        driver_instance: WebDriver instance
+        auth_state: Session auth state from a previous form login
+
+    Returns:
+        bool: True if state was restored (session validity is checked by caller)
+    """
+    try:
+        # Cookies can only be set for the current origin - load a cheap page on it
+        driver_instance.get(f"{TestConfig.BASE_URL}/favicon.ico")
+
+        for cookie in auth_state["cookies"]:
+            driver_instance.add_cookie(cookie)
+
+        driver_instance.execute_script(
+            "var items = JSON.parse(arguments[0]);"
+            "for (var key in items) { window.localStorage.setItem(key, items[key]); }",
+            auth_state["local_storage"] or "{}",
+        )
+
+        driver_instance.get(auth_state["url"])
+        return True
+
+    except Exception as e:
+        logger.warning(f"✗ Failed to restore auth state: {e}")
+        return False
 
 
 @pytest.fixture(scope="function")
-def system_update_page(driver, login_page) -> SystemUpdatePage:
+def system_update_page(authenticated_driver) -> SystemUpdatePage:
     """
     System Update Page fixture.
 
     Provides:
     - Initialized SystemUpdatePage object
-    - User is already logged in (depends on login_page fixture)
+    - User is already logged in (depends on authenticated_driver fixture)
     - Ready to interact with System Updates page
 
     Args:
-        driver: WebDriver fixture
-        login_page: LoginPage fixture (ensures user is logged in)
+        authenticated_driver: Logged-in WebDriver fixture
 
     Returns:
         SystemUpdatePage: Initialized SystemUpdatePage object
@@ -326,8 +632,8 @@ def system_update_page(driver, login_page) -> SystemUpdatePage:
     """
     logger.debug("Creating SystemUpdatePage fixture")
 
-    # Create page object (user already logged in via login_page fixture)
-    page = SystemUpdatePage(driver)
+    # Create page object (user already logged in via authenticated_driver fixture)
+    page = SystemUpdatePage(authenticated_driver)
 
     # Navigate to System Updates page
     page.navigate()
@@ -370,6 +676,8 @@ def test_failure_handler(request, driver):
     - Browser logs
     - Page information
 
+    SSH/backend failures only get a traceback file (page state is irrelevant).
+
     Args:
         request: Pytest request fixture
         driver: WebDriver fixture
@@ -380,34 +688,63 @@ def test_failure_handler(request, driver):
     # Before test - nothing to do
     yield
 
-    # After test - check for failure
-    if hasattr(request.node, "rep_call"):
-        if request.node.rep_call.failed:
-            test_name = request.node.name
-            test_id = _extract_test_id(request.node)
+    # After test - check for failure (report stored by pytest_runtest_makereport)
+    rep_call = getattr(request.node, "rep_call", None)
+    if rep_call is not None and rep_call.failed:
+        test_name = request.node.name
+        test_id = _extract_test_id(request.node)
 
-            logger.error("=" * 80)
-            logger.error(f"TEST FAILED: {test_name}")
-            logger.error("=" * 80)
+        logger.error("=" * 80)
+        logger.error(f"TEST FAILED: {test_name}")
+        logger.error("=" * 80)
 
-            try:
-                # Capture failure artifacts
-                artifacts = DebugHelper.capture_failure_artifacts(
-                    driver, test_name, test_id, exception=request.node.rep_call.longrepr
-                )
+        try:
+            # Capture failure artifacts (DOM artifacts skipped for SSH/backend failures)
+            artifacts = DebugHelper.capture_failure_artifacts(
+                driver,
+                test_name,
+                test_id,
+                exception=rep_call.longrepr,
+                dom_artifacts=not _is_backend_failure(rep_call),
+            )
 
-                # Attach artifacts to Allure report
-                for artifact_type, artifact_path in artifacts.items():
-                    if os.path.exists(artifact_path):
-                        _attach_to_allure(artifact_path, artifact_type)
+            # Attach artifacts to Allure report
+            for artifact_type, artifact_path in artifacts.items():
+                if os.path.exists(artifact_path):
+                    _attach_to_allure(artifact_path, artifact_type)
 
-            except Exception as e:
-                logger.error(f"Failed to capture failure artifacts: {e}")
+        except Exception as e:
+            logger.error(f"Failed to capture failure artifacts: {e}")
+
+
+# Failure messages that point at the backend rather than page state
+_BACKEND_FAILURE = re.compile(r"SSH|Backend|ConnectionError")
+
+
+def _is_backend_failure(report) -> bool:
+    """
+    Check whether a failed report was raised by an SSH/backend check.
+
+    Only the crash line is matched - the full longrepr includes test source,
+    which mentions the backend in most multi-level tests.
+
+    Args:
+        report: Pytest TestReport for the call phase
+
+    Returns:
+        bool: True if screenshot/HTML/browser logs would not help diagnose it
+    """
+    crash = getattr(report.longrepr, "reprcrash", None)
+    message = crash.message if crash else str(report.longrepr)
+    return bool(_BACKEND_FAILURE.search(message))
+
+
+_TEST_ID_KEY = pytest.StashKey[str]()
 
 
 def _extract_test_id(node) -> str:
     """
-    Extract test case ID from test node markers.
+    Extract test case ID from test node markers (cached on the node).
 
     Args:
         node: Pytest test node
@@ -415,12 +752,21 @@ def _extract_test_id(node) -> str:
     Returns:
         str: Test case ID (e.g., "TC-SYS-001") or test name
     """
+    if _TEST_ID_KEY in node.stash:
+        return node.stash[_TEST_ID_KEY]
+
     # Try to get test ID from Allure testcase marker
-    for marker in node.iter_markers("allure_label"):
-        if marker.kwargs.get("label_type") == "testcase":
-            return marker.kwargs.get("name", node.name)
+    test_id = next(
+        (
+            marker.kwargs.get("name", node.name)
+            for marker in node.iter_markers("allure_label")
+            if marker.kwargs.get("label_type") == "testcase"
+        ),
+        node.name,
+    )
 
-    return node.name
+    node.stash[_TEST_ID_KEY] = test_id
+    return test_id
 
 
 def _attach_to_allure(file_path: str, attachment_type: str):
@@ -460,11 +806,15 @@ def _attach_to_allure(file_path: str, attachment_type: str):
 # ==================== Pytest Configuration ====================
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """
     Pytest configuration hook - runs once at start.
 
-    Registers custom markers for test categorization.
+    Registers custom markers for test categorization, defaults
+    pytest-xdist to loadscope scheduling, gives each xdist worker its
+    own Allure results directory (tryfirst: before allure-pytest reads it)
+    and starts the background WebDriver binary lookup.
     """
     config.addinivalue_line("markers", "smoke: mark test as smoke test")
     config.addinivalue_line("markers", "regression: mark test as regression test")
@@ -475,6 +825,25 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "P2: mark test as Priority 2 (Medium)")
     config.addinivalue_line("markers", "P3: mark test as Priority 3 (Low)")
 
+    # pytest-xdist: keep each test class (or module, for plain functions) on one
+    # worker so it reuses that worker's session browser/login - new classes get
+    # this automatically (explicit --dist/-d wins)
+    args = config.invocation_params.args
+    dist_given = any(str(arg).startswith("--dist") or arg == "-d" for arg in args)
+    if getattr(config.option, "numprocesses", None) and not dist_given:
+        config.option.dist = "loadscope"
+
+    # pytest-xdist: per-worker Allure results (<alluredir>/<worker id>), same as LOGS_DIR
+    alluredir = getattr(config.option, "allure_report_dir", None)
+    if XDIST_WORKER and alluredir:
+        config.option.allure_report_dir = os.path.join(alluredir, XDIST_WORKER)
+
+    # Resolve the driver binary while collection runs (the xdist controller and
+    # --collect-only never start a browser)
+    xdist_controller = getattr(config.option, "numprocesses", None) and not XDIST_WORKER
+    if not xdist_controller and not config.option.collectonly:
+        config.stash[_PREFETCH_KEY] = _start_driver_binary_prefetch()
+
 
 # ==================== Helper Fixtures ====================
 
@@ -514,20 +883,69 @@ def debug_helper(driver):
     return DebugHelper
 
 
+@pytest.fixture(scope="module")
+def background_executor() -> Generator[ThreadPoolExecutor, None, None]:
+    """
+    Thread pool for overlapping independent backend calls with UI steps.
+
+    Module-scoped so the worker threads are created once per test module.
+
+    Yields:
+        ThreadPoolExecutor: Executor for background verification calls
+
+    Example:
+        >>> def test_example(system_update_page, backend_verifier, background_executor):
+        ...     future = background_executor.submit(backend_verifier.get_kernel_version)
+        ...     ui_version = system_update_page.get_kernel_version()
+        ...     assert ui_version == future.result()
+    """
+    executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="verify")
+    yield executor
+    executor.shutdown(wait=True)
+
+
 # ==================== Verification Fixtures ====================
 
 
 @pytest.fixture(scope="session")
-def ssh_helper():
+def ssh_pool() -> Generator[type[SSHConnectionPool], None, None]:
+    """
+    SSH connection pool fixture.
+
+    Scope: session (pooled connections live until session end)
+
+    Connections are keyed by (host, port, username) with a lock per key;
+    every caller with the same key shares one transport and dead
+    connections are re-established on acquire().
+
+    Yields:
+        SSHConnectionPool: Pool class (call acquire(ssh_config))
+
+    Example:
+        >>> def test_backend(ssh_pool):
+        ...     ssh = ssh_pool.acquire(TestConfig.SSH_CONFIG)
+        ...     output = ssh.execute_command_with_output('uname -r')
+    """
+    yield SSHConnectionPool
+
+    SSHConnectionPool.close_all()
+    logger.info("✓ SSH connection pool closed")
+
+
+@pytest.fixture(scope="session")
+def ssh_helper(ssh_pool):
     """
     SSH Helper fixture for backend operations.
 
     Scope: session (reuses connection across tests)
 
     Provides:
-    - SSH connection to IWSVA server
+    - SSH connection to IWSVA server (from ssh_pool)
     - Automatic connection management
-    - Automatic cleanup after session
+    - Automatic cleanup after session (pool teardown)
+
+    Args:
+        ssh_pool: SSH connection pool fixture
 
     Returns:
         SSHHelper: Connected SSH helper instance
@@ -540,26 +958,17 @@ def ssh_helper():
     logger.info("INITIALIZING SSH CONNECTION")
     logger.info("=" * 60)
 
-    # Create SSH helper
-    ssh = create_ssh_helper(TestConfig.SSH_CONFIG)
-
     try:
-        # Connect to server
-        ssh.connect()
+        # Connect to server (closed by ssh_pool teardown)
+        ssh = ssh_pool.acquire(TestConfig.SSH_CONFIG)
         logger.info("✓ SSH connection established")
 
-        yield ssh
-
     except Exception as e:
         logger.error(f"✗ SSH connection failed: {e}")
         logger.warning("Backend verification tests will be skipped")
-        yield None
+        ssh = None
 
-    finally:
-        # Cleanup
-        if ssh and ssh.connected:
-            ssh.disconnect()
-            logger.info("✓ SSH connection closed")
+    return ssh
 
 
 @pytest.fixture(scope="function")
@@ -591,10 +1000,10 @@ def backend_verifier(ssh_helper):
 
     logger.debug("Creating BackendVerification fixture")
 
-    # Create backend verifier with existing SSH connection
-    verifier = BackendVerification(TestConfig.SSH_CONFIG)
-    verifier.ssh = ssh_helper  # Reuse session SSH connection
-    verifier.connected = ssh_helper.connected
+    # Create backend verifier on the pooled session SSH connection
+    # (acquire() transparently reconnects if the transport dropped)
+    verifier = BackendVerification(TestConfig.SSH_CONFIG, use_pool=True)
+    verifier.connect()
 
     logger.info("✓ BackendVerification fixture ready")
 
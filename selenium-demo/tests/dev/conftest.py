@@ -0,0 +1,56 @@
+"""Development test fixtures — standalone Chrome shared across the dev session."""
+
+import os
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+# Attach to an already running Chrome (--remote-debugging-port) instead of launching one
+REUSE_CHROME = os.getenv("REUSE_CHROME") == "1"
+CHROME_DEBUGGER_ADDRESS = os.getenv("CHROME_DEBUGGER_ADDRESS", "127.0.0.1:9222")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_session_setup():
+    """Override the root session setup - dev tests need no IWSVA config or driver prefetch."""
+    yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_failure_handler():
+    """Override the root failure handler, which would start the main suite's browser."""
+    yield
+
+
+@pytest.fixture(scope="session")
+def chrome_driver():
+    """
+    Headless Chrome shared by all dev tests in the session.
+
+    With REUSE_CHROME=1 the fixture attaches to a persistent Chrome and
+    leaves it running at teardown.
+    """
+    options = ChromeOptions()
+    options.page_load_strategy = "eager"  # pages are usable at DOMContentLoaded
+    if REUSE_CHROME:
+        # Browser flags were set when the persistent Chrome was launched
+        options.add_experimental_option("debuggerAddress", CHROME_DEBUGGER_ADDRESS)
+    else:
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--ignore-certificate-errors")
+
+    # No executable_path: Selenium Manager resolves ChromeDriver from its local cache
+    browser = webdriver.Chrome(service=ChromeService(), options=options)
+    browser.implicitly_wait(0)  # explicit waits only
+
+    yield browser
+
+    if REUSE_CHROME:
+        # Leave the shared browser running for the next attach
+        browser.service.stop()
+    else:
+        browser.quit()
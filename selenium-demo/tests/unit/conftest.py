@@ -0,0 +1,15 @@
+"""Unit test fixtures — offline, no browser, SSH server or IWSVA config needed."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_session_setup():
+    """Override the root session setup (config validation, driver prefetch)."""
+    yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_failure_handler():
+    """Override the root failure handler, which needs a WebDriver."""
+    yield
@@ -0,0 +1,101 @@
+"""Unit tests for BackendVerification batched section commands."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from frameworks.verification.backend_verification import BackendVerification
+
+SSH_CONFIG = {"host": "127.0.0.1", "port": 22, "username": "root", "password": "secret"}
+
+
+def _section_output(sections: dict[str, tuple[str, int]]) -> str:
+    """Build the stdout the remote shell prints for _execute_sections."""
+    lines = []
+    for name, (output, exit_code) in sections.items():
+        lines.append(BackendVerification.SECTION_MARKER.format(name))
+        if output:
+            lines.append(output)
+        lines.append(BackendVerification.EXIT_MARKER.format(exit_code))
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def verifier():
+    """BackendVerification whose SSH helper is a mock (never connects)."""
+    backend = BackendVerification(SSH_CONFIG)
+    backend.ssh = MagicMock()
+    return backend
+
+
+@pytest.mark.unit
+class TestExecuteSections:
+    """_execute_sections script building and output splitting."""
+
+    def test_splits_output_and_exit_codes(self, verifier):
+        """Each section gets its own stripped output and exit code."""
+        verifier.ssh.execute_command.return_value = (
+            _section_output({"kernel": ("5.14.0", 0), "multi": ("a\nb", 0), "bad": ("", 127)}),
+            "",
+            0,
+        )
+
+        outputs, exit_codes = verifier._execute_sections(
+            {"kernel": "uname -r", "multi": "printf 'a\\nb'", "bad": "nosuchcmd"}
+        )
+
+        assert outputs == {"kernel": "5.14.0", "multi": "a\nb", "bad": ""}
+        assert exit_codes == {"kernel": 0, "multi": 0, "bad": 127}
+        verifier.ssh.execute_command.assert_called_once()
+
+    def test_missing_section(self, verifier):
+        """A section that never ran is empty with exit code -1."""
+        verifier.ssh.execute_command.return_value = (
+            _section_output({"kernel": ("5.14.0", 0)}),
+            "",
+            0,
+        )
+
+        outputs, exit_codes = verifier._execute_sections({"kernel": "uname -r", "uptime": "uptime"})
+
+        assert outputs["uptime"] == ""
+        assert exit_codes["uptime"] == -1
+
+    def test_script_runs_every_command(self, verifier):
+        """All commands go into one script, each followed by its exit status."""
+        verifier.ssh.execute_command.return_value = ("", "", 0)
+
+        verifier._execute_sections({"kernel": "uname -r", "host": "hostname"})
+
+        script = verifier.ssh.execute_command.call_args[0][0]
+        assert "uname -r" in script and "hostname" in script
+        assert script.count("$?") == 2
+
+    def test_health_bundle_includes_exit_codes(self, verifier):
+        """get_health_bundle exposes per-section exit codes."""
+        verifier.ssh.execute_command.return_value = (
+            _section_output(
+                {
+                    "kernel_version": ("5.14.0", 0),
+                    "service_state": ("inactive", 3),
+                    "hostname": ("iwsva", 0),
+                    "uptime": ("up 1 day", 0),
+                }
+            ),
+            "",
+            0,
+        )
+
+        bundle = verifier.get_health_bundle()
+
+        assert bundle["service_state"] == "inactive"
+        assert bundle["exit_codes"]["service_state"] == 3
+
+    def test_system_info_bulk_raises_on_failed_field(self, verifier):
+        """get_system_info_bulk keeps get_system_info's raise-on-failure contract."""
+        sections = {name: ("value", 0) for name in BackendVerification.SYSTEM_INFO_COMMANDS}
+        sections["os_version"] = ("", 1)
+        verifier.ssh.execute_command.return_value = (_section_output(sections), "", 0)
+
+        with pytest.raises(RuntimeError, match="os_version"):
+            verifier.get_system_info_bulk()
@@ -0,0 +1,82 @@
+"""Unit tests for LogVerification line matching and classification."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from frameworks.verification.log_verification import LogVerification
+
+LOG = "\n".join(
+    [
+        "2026-01-01 10:00:00 Update started for component: PTN",
+        "2026-01-01 10:00:05 WARNING slow mirror",
+        "2026-01-01 10:00:09 ERROR download failed",
+        "2026-01-01 10:00:10 Update completed successfully for component: PTN",
+        "2026-01-01 10:00:11 idle",
+    ]
+)
+
+
+@pytest.fixture
+def log_verifier():
+    """LogVerification with a dummy SSH helper (log content is always passed in)."""
+    return LogVerification(MagicMock())
+
+
+@pytest.mark.unit
+class TestClassify:
+    """LINE_CLASSIFIER / classify bucketing."""
+
+    def test_default_categories_counts(self, log_verifier):
+        """Each line lands in every category it matches, once."""
+        buckets = log_verifier.classify(log_content=LOG)
+
+        assert len(buckets["error"]) == 1
+        assert len(buckets["warning"]) == 1
+        assert len(buckets["success"]) == 1
+        assert buckets["error"][0].endswith("ERROR download failed")
+
+    def test_default_classifier_is_line_classifier(self):
+        """The fused regex reports the matching category as lastgroup."""
+        match = LogVerification.LINE_CLASSIFIER.search("WARN disk almost full")
+
+        assert match is not None
+        assert match.lastgroup == "warning"
+
+    def test_custom_patterns(self, log_verifier):
+        """Custom categories are matched case-insensitively."""
+        buckets = log_verifier.classify(
+            log_content=LOG, patterns={"started": r"update started", "idle": r"IDLE"}
+        )
+
+        assert len(buckets["started"]) == 1
+        assert len(buckets["idle"]) == 1
+
+    def test_pattern_does_not_span_lines(self, log_verifier):
+        """A pattern can't match across a line break."""
+        buckets = log_verifier.classify(
+            log_content="kernel\nupdate ok", patterns={"kernel_update": r"kernel\s+update"}
+        )
+
+        assert buckets["kernel_update"] == []
+
+
+@pytest.mark.unit
+class TestIterMatches:
+    """iter_matches per-line matching."""
+
+    def test_yields_matching_lines(self, log_verifier):
+        """Matching lines are yielded stripped, in order."""
+        matches = list(log_verifier.iter_matches(r"component: PTN", log_content=LOG))
+
+        assert len(matches) == 2
+        assert matches[0].endswith("Update started for component: PTN")
+
+    def test_case_sensitivity(self, log_verifier):
+        """Matching ignores case unless case_sensitive is set."""
+        assert list(log_verifier.iter_matches("error", log_content=LOG))
+        assert not list(log_verifier.iter_matches("warn", log_content=LOG, case_sensitive=True))
+
+    def test_pattern_does_not_span_lines(self, log_verifier):
+        """A pattern can't match across a line break."""
+        assert list(log_verifier.iter_matches(r"kernel\s+update", "kernel\nupdate ok")) == []
@@ -0,0 +1,65 @@
+"""Unit tests for SSHConnectionPool connection reuse."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.helpers import ssh_helper
+from core.helpers.ssh_helper import SSHConnectionPool
+
+SSH_CONFIG = {"host": "10.0.0.1", "port": 22, "username": "root", "password": "secret"}
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Replace create_ssh_helper with a factory of mock helpers; yields the created list."""
+    helpers = []
+
+    def fake_create(ssh_config):
+        helper = MagicMock()
+        helper.is_alive.return_value = False
+        helper.connect.side_effect = lambda: helper.is_alive.configure_mock(return_value=True)
+        helpers.append(helper)
+        return helper
+
+    monkeypatch.setattr(ssh_helper, "create_ssh_helper", fake_create)
+    SSHConnectionPool.close_all()
+    yield helpers
+    SSHConnectionPool.close_all()
+
+
+@pytest.mark.unit
+class TestSSHConnectionPool:
+    """Pool keying by (host, port, username)."""
+
+    def test_same_key_reuses_connection(self, created):
+        """Two acquires with the same config share one connected helper."""
+        first = SSHConnectionPool.acquire(SSH_CONFIG)
+        second = SSHConnectionPool.acquire(dict(SSH_CONFIG))
+
+        assert first is second
+        assert len(created) == 1
+        first.connect.assert_called_once()
+
+    def test_default_port_matches_explicit_22(self, created):
+        """A config without a port maps to the same key as port 22."""
+        config = {k: v for k, v in SSH_CONFIG.items() if k != "port"}
+
+        assert SSHConnectionPool.acquire(config) is SSHConnectionPool.acquire(SSH_CONFIG)
+
+    def test_different_user_gets_own_connection(self, created):
+        """A different username is a different key."""
+        first = SSHConnectionPool.acquire(SSH_CONFIG)
+        second = SSHConnectionPool.acquire(dict(SSH_CONFIG, username="admin"))
+
+        assert first is not second
+        assert len(created) == 2
+
+    def test_stale_connection_reconnects(self, created):
+        """An inactive pooled transport is reconnected, not replaced."""
+        helper = SSHConnectionPool.acquire(SSH_CONFIG)
+        helper.is_alive.return_value = False
+
+        assert SSHConnectionPool.acquire(SSH_CONFIG) is helper
+        assert helper.connect.call_count == 2
+        assert len(created) == 1
@@ -0,0 +1,40 @@
+"""Unit tests for SystemUpdatePage kernel version parsing."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from frameworks.pages.system_update_page import SystemUpdatePage
+
+KERNEL = "5.14.0-427.24.1.el9_4.x86_64"
+
+
+@pytest.fixture
+def page():
+    """SystemUpdatePage on a mock driver (parsing never touches it)."""
+    return SystemUpdatePage(MagicMock())
+
+
+@pytest.mark.unit
+class TestExtractKernelVersion:
+    """extract_kernel_version on page text."""
+
+    def test_finds_version(self, page):
+        """The version is extracted from surrounding text."""
+        assert page.extract_kernel_version(f"Kernel Version: {KERNEL}\nOS: Rocky") == KERNEL
+
+    def test_not_found(self, page):
+        """Text without a kernel version returns None."""
+        assert page.extract_kernel_version("System Updates\nNo data") is None
+
+    def test_version_past_scan_window(self, page):
+        """A version beyond max_scan is found by the full rescan."""
+        content = "x" * 100 + KERNEL
+
+        assert page.extract_kernel_version(content, max_scan=50) == KERNEL
+
+    def test_version_straddling_scan_window(self, page):
+        """A version cut by the max_scan boundary is still found."""
+        content = "x" * 40 + KERNEL
+
+        assert page.extract_kernel_version(content, max_scan=50) == KERNEL
@@ -0,0 +1,69 @@
+"""Unit tests for VerificationWorkflow batch verification."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.config.test_config import TestConfig
+from frameworks.workflows.verification_workflow import VerificationWorkflow
+
+INI_MTIME = 1700000000.0
+VERSIONS = {"PTN": "1.2.3", "ENG": "2.3.4"}
+
+
+@pytest.fixture
+def workflow(monkeypatch, tmp_path):
+    """Workflow with a mock backend, an isolated state file and a mocked _save_state."""
+    monkeypatch.setattr(TestConfig, "VERIFICATION_STATE_FILE", str(tmp_path / "state.json"))
+
+    backend = MagicMock()
+    backend.get_ini_mtime.return_value = INI_MTIME
+
+    instance = VerificationWorkflow(MagicMock(), backend_verifier=backend, ui_verifier=MagicMock())
+    instance._save_state = MagicMock()
+    return instance
+
+
+@pytest.mark.unit
+class TestVerificationState:
+    """Last-known-good state reuse across batch runs."""
+
+    def test_fully_cached_batch_does_not_save(self, workflow):
+        """A batch answered entirely from state leaves the state file alone."""
+        workflow._state = {
+            component_id: {
+                "version": version,
+                "ini_mtime": INI_MTIME,
+                "last_verified_ts": "2026-01-01T00:00:00",
+            }
+            for component_id, version in VERSIONS.items()
+        }
+        previous_state = dict(workflow._state)
+
+        result = workflow.verify_multiple_components(list(VERSIONS), VERSIONS)
+
+        assert result["passed_count"] == len(VERSIONS)
+        assert all(r["cached"] for r in result["component_results"].values())
+        assert workflow._state == previous_state
+        workflow._save_state.assert_not_called()
+        workflow.backend_verifier.get_component_version_from_ini.assert_not_called()
+
+
+@pytest.mark.unit
+class TestBatchDeduplication:
+    """Duplicate component IDs in verify_multiple_components."""
+
+    def test_duplicate_ids_looked_up_once(self, workflow):
+        """Each unique component is fetched once and counted once, in first-seen order."""
+        # Disable the version cache so every lookup would reach the backend
+        workflow.VERSION_CACHE_TTL = 0
+        workflow.backend_verifier.get_component_version_from_ini.side_effect = (
+            lambda component_id, max_age: VERSIONS[component_id]
+        )
+
+        result = workflow.verify_multiple_components(["PTN", "ENG", "PTN", "ENG", "PTN"], VERSIONS)
+
+        assert result["total_count"] == 2
+        assert result["passed_count"] == 2
+        assert list(result["component_results"]) == ["PTN", "ENG"]
+        assert workflow.backend_verifier.get_component_version_from_ini.call_count == 2